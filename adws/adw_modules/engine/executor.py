@@ -5,6 +5,7 @@ Workflow definitions (Tier 1) never see ROP internals.
 """
 from __future__ import annotations
 
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 from returns.io import IOFailure, IOResult, IOSuccess
@@ -39,6 +40,8 @@ from adws.adw_modules.steps import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from adws.adw_modules.engine.types import (
         Step,
         StepFunction,
@@ -46,7 +49,9 @@ if TYPE_CHECKING:
     )
     from adws.adw_modules.types import WorkflowContext
 
-_STEP_REGISTRY: dict[str, StepFunction] = {
+# Built once at import and exposed read-only: every SDK step
+# dispatch reads it, nothing is allowed to register at runtime.
+_STEP_REGISTRY: Mapping[str, StepFunction] = MappingProxyType({
     "block_dangerous_command": block_dangerous_command,
     "block_dangerous_command_safe": (
         block_dangerous_command_safe
@@ -76,7 +81,7 @@ _STEP_REGISTRY: dict[str, StepFunction] = {
     "verify_tests_fail": verify_tests_fail,
     "write_beads_id": write_beads_id,
     "write_failing_tests": write_failing_tests,
-}
+})
 
 
 def _resolve_step_function(
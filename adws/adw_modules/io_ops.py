@@ -913,6 +913,11 @@ def write_hook_log(
     exist. Appends event_json + newline to the file named
     <session_id>.jsonl. Returns IOSuccess(None) on success.
     Sanitizes session_id to prevent path traversal.
+
+    Each hook invocation is a short-lived process that logs
+    one event, so the line is encoded once and appended in
+    binary mode: a single write per event with no text-layer
+    wrapper, and a fixed UTF-8 encoding.
     """
     try:
         safe_id = _sanitize_session_id(session_id)
@@ -920,8 +925,8 @@ def write_hook_log(
         log_dir = root / "agents" / "hook_logs"
         log_dir.mkdir(parents=True, exist_ok=True)
         log_file = log_dir / f"{safe_id}.jsonl"
-        with log_file.open("a") as f:
-            f.write(event_json + "\n")
+        with log_file.open("ab") as f:
+            f.write(f"{event_json}\n".encode())
     except (PermissionError, OSError) as exc:
         return IOFailure(
             PipelineError(
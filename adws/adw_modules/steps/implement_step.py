@@ -43,54 +43,65 @@ GREEN_PHASE_SYSTEM_PROMPT = (
     " one per line, with their full paths."
 )
 
+# Only the prompt varies between GREEN phase calls, so the
+# fixed fields are validated once here and copied per call.
+_GREEN_PHASE_REQUEST_TEMPLATE = AdwsRequest(
+    model=DEFAULT_CLAUDE_MODEL,
+    system_prompt=GREEN_PHASE_SYSTEM_PROMPT,
+    prompt="",
+    permission_mode="bypassPermissions",
+)
+
 
 def _build_green_phase_request(
     ctx: WorkflowContext,
 ) -> AdwsRequest:
     """Build AdwsRequest for the GREEN phase SDK call.
 
-    Pure function: constructs request from context inputs.
+    Pure function: collects prompt sections from context
+    inputs and joins them once.
     """
+    sections: list[str] = []
     description = ctx.inputs.get("issue_description")
     if isinstance(description, str) and description.strip():
-        prompt = (
+        sections.append(
             "Implement the minimum code to make"
             " all failing tests pass for the"
             " following story:\n\n"
-            f"{description}"
+            f"{description}",
         )
     else:
-        prompt = (
+        sections.append(
             "No issue description was provided."
             " Implement the minimum code to make"
             " all failing tests pass based on"
             " the project context you can read"
-            " from the repository."
+            " from the repository.",
         )
 
     test_files = ctx.inputs.get("test_files")
     if isinstance(test_files, list) and test_files:
         files_text = "\n".join(str(f) for f in test_files)
-        prompt += (
-            "\n\n## Test Files to Make Pass\n"
-            f"{files_text}"
+        sections.append(
+            "## Test Files to Make Pass\n"
+            f"{files_text}",
         )
 
     if ctx.feedback:
         feedback_text = "\n".join(ctx.feedback)
-        prompt += (
-            "\n\n## Previous Feedback\n"
-            f"{feedback_text}"
+        sections.append(
+            "## Previous Feedback\n"
+            f"{feedback_text}",
         )
 
-    return AdwsRequest(
-        model=DEFAULT_CLAUDE_MODEL,
-        system_prompt=GREEN_PHASE_SYSTEM_PROMPT,
-        prompt=prompt,
-        permission_mode="bypassPermissions",
+    prompt = "\n\n".join(sections)
+
+    return _GREEN_PHASE_REQUEST_TEMPLATE.model_copy(
+        update={"prompt": prompt},
     )
 
 
+_IMPL_FILE_PREFIX = "adws/adw_modules/"
 _IMPL_FILE_PATTERN = re.compile(
     r"(adws/adw_modules/\S+\.py)",
 )
@@ -103,21 +114,16 @@ def _extract_implementation_files(
 
     Pure function: uses regex to find adws/adw_modules/
     paths. Returns deduplicated list preserving insertion
-    order. Handles None result gracefully.
+    order. Handles None result gracefully, and skips the
+    regex scan when the path prefix never appears.
     """
-    if response.result is None:
+    text = response.result
+    if not text or _IMPL_FILE_PREFIX not in text:
         return []
 
-    matches = _IMPL_FILE_PATTERN.findall(
-        response.result,
+    return list(
+        dict.fromkeys(_IMPL_FILE_PATTERN.findall(text)),
     )
-    seen: set[str] = set()
-    result: list[str] = []
-    for match in matches:
-        if match not in seen:
-            seen.add(match)
-            result.append(match)
-    return result
 
 
 def _process_implement_response(
@@ -158,6 +164,24 @@ def _process_implement_response(
     )
 
 
+def _attribute_sdk_failure(
+    error: PipelineError,
+) -> IOResult[AdwsResponse, PipelineError]:
+    """Re-attribute an SDK boundary failure to implement_step.
+
+    Module-level so implement_step does not rebuild a closure
+    on every call; it captures nothing from the call site.
+    """
+    return IOFailure(
+        PipelineError(
+            step_name="implement_step",
+            error_type=error.error_type,
+            message=error.message,
+            context=error.context,
+        ),
+    )
+
+
 def implement_step(
     ctx: WorkflowContext,
 ) -> IOResult[WorkflowContext, PipelineError]:
@@ -170,21 +194,9 @@ def implement_step(
     request = _build_green_phase_request(ctx)
     sdk_result = io_ops.execute_sdk_call(request)
 
-    def _on_failure(
-        error: PipelineError,
-    ) -> IOResult[AdwsResponse, PipelineError]:
-        return IOFailure(
-            PipelineError(
-                step_name="implement_step",
-                error_type=error.error_type,
-                message=error.message,
-                context=error.context,
-            ),
-        )
-
     return (
         sdk_result
-        .lash(_on_failure)
+        .lash(_attribute_sdk_failure)
         .bind(
             lambda resp: _process_implement_response(
                 resp, ctx,
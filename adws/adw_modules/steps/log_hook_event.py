@@ -8,7 +8,6 @@ from __future__ import annotations
 from datetime import UTC, datetime
 
 from returns.io import IOFailure, IOResult, IOSuccess
-from returns.unsafe import unsafe_perform_io
 
 from adws.adw_modules import io_ops
 from adws.adw_modules.errors import PipelineError
@@ -57,12 +56,10 @@ def log_hook_event(
             ),
         )
 
+    now = datetime.now(tz=UTC)
     session_id = ctx.inputs.get("session_id")
     if not isinstance(session_id, str) or not session_id:
-        ts = datetime.now(tz=UTC).strftime(
-            "%Y%m%d%H%M%S",
-        )
-        session_id = f"unknown-{ts}"
+        session_id = f"unknown-{now:%Y%m%d%H%M%S}"
 
     payload_raw = ctx.inputs.get("payload")
     payload: dict[str, object] = (
@@ -72,7 +69,7 @@ def log_hook_event(
     )
 
     event = HookEvent(
-        timestamp=datetime.now(tz=UTC).isoformat(),
+        timestamp=now.isoformat(),
         event_type=event_type,
         hook_name=hook_name,
         session_id=session_id,
@@ -116,27 +113,26 @@ def log_hook_event_safe(
 ) -> IOResult[WorkflowContext, PipelineError]:
     """Fail-open wrapper for hook event logging (NFR4).
 
-    Calls log_hook_event(). On failure, logs to stderr
-    and returns IOSuccess with failure info in outputs.
+    Calls log_hook_event() and recovers its failure track
+    in place via lash: logs to stderr and returns IOSuccess
+    with failure info in outputs.
     NEVER returns IOFailure -- fail-open means never
     blocking the observed operation.
     """
-    result = log_hook_event(ctx)
-    if isinstance(result, IOSuccess):
-        return result
-
-    error = unsafe_perform_io(result.failure())
-    error_msg = str(error)
-
-    io_ops.write_stderr(
-        f"log_hook_event_safe: {error_msg}\n",
-    )
+    def _fail_open(
+        error: PipelineError,
+    ) -> IOResult[WorkflowContext, PipelineError]:
+        error_msg = str(error)
+        io_ops.write_stderr(
+            f"log_hook_event_safe: {error_msg}\n",
+        )
+        return IOSuccess(
+            ctx.with_updates(
+                outputs={
+                    "hook_event_logged": False,
+                    "hook_event_error": error_msg,
+                },
+            ),
+        )
 
-    return IOSuccess(
-        ctx.with_updates(
-            outputs={
-                "hook_event_logged": False,
-                "hook_event_error": error_msg,
-            },
-        ),
-    )
+    return log_hook_event(ctx).lash(_fail_open)
@@ -102,24 +102,18 @@ def _extract_refactored_files(
 ) -> list[str]:
     """Extract file paths from SDK response.
 
-    Pure function: uses regex to find adws/ paths
-    (both source and test files). Returns deduplicated
-    list preserving insertion order. Handles None result
-    gracefully.
+    Pure function: uses the precompiled pattern to find
+    adws/ paths (both source and test files). Returns
+    deduplicated list preserving insertion order. Handles
+    None result gracefully.
     """
-    if response.result is None:
+    text = response.result
+    if not text:
         return []
 
-    matches = _REFACTOR_FILE_PATTERN.findall(
-        response.result,
+    return list(
+        dict.fromkeys(_REFACTOR_FILE_PATTERN.findall(text)),
     )
-    seen: set[str] = set()
-    result: list[str] = []
-    for match in matches:
-        if match not in seen:
-            seen.add(match)
-            result.append(match)
-    return result
 
 
 def _process_refactor_response(
@@ -34,13 +34,16 @@ RED_GATE_PYTEST_COMMAND: str = (
     " -m 'not enemy' --no-header -q"
 )
 
-_ERROR_TYPE_PATTERN = re.compile(
-    r"^E\s+(\w+Error)\b", re.MULTILINE,
+# One alternation so pytest output is scanned once; the
+# named group that matched says which marker was found.
+_PYTEST_MARKER_PATTERN = re.compile(
+    r"^E\s+(?P<error_type>\w+Error)\b"
+    r"|(?P<failed>\d+) failed"
+    r"|(?P<passed>\d+) passed"
+    r"|(?P<errors>\d+) errors? in "
+    r"|(?P<no_tests>no tests ran)",
+    re.MULTILINE,
 )
-_FAILED_COUNT_PATTERN = re.compile(r"(\d+) failed")
-_NO_TESTS_RAN_PATTERN = re.compile(r"no tests ran")
-_PASSED_PATTERN = re.compile(r"(\d+) passed")
-_ERROR_COUNT_PATTERN = re.compile(r"(\d+) errors? in ")
 
 
 @dataclass(frozen=True)
@@ -84,8 +87,19 @@ def _parse_pytest_output(
             raw_output=raw_output,
         )
 
+    # Collect every error type, and the first hit of
+    # each summary marker, in a single pass
+    error_type_set: set[str] = set()
+    markers: dict[str, str] = {}
+    for match in _PYTEST_MARKER_PATTERN.finditer(combined):
+        kind = match.lastgroup or ""
+        if kind == "error_type":
+            error_type_set.add(match[kind])
+        else:
+            markers.setdefault(kind, match[kind])
+
     # Check for "no tests ran"
-    if _NO_TESTS_RAN_PATTERN.search(combined):
+    if "no_tests" in markers:
         return ParsedTestResult(
             tests_ran=False,
             all_passed=False,
@@ -94,41 +108,36 @@ def _parse_pytest_output(
             raw_output=raw_output,
         )
 
-    # Extract error types from E lines
-    error_types = frozenset(
-        _ERROR_TYPE_PATTERN.findall(combined),
-    )
+    error_types = frozenset(error_type_set)
 
     # Extract failure count from summary
-    failed_match = _FAILED_COUNT_PATTERN.search(combined)
+    failed_count = markers.get("failed")
     failure_count = (
-        int(failed_match.group(1))
-        if failed_match
+        int(failed_count)
+        if failed_count
         else 0
     )
 
     # Check if errors occurred (collection errors count)
-    error_count_match = _ERROR_COUNT_PATTERN.search(
-        combined,
-    )
-    if not failed_match and error_count_match:
-        failure_count = int(error_count_match.group(1))
+    error_count = markers.get("errors")
+    if not failed_count and error_count:
+        failure_count = int(error_count)
 
     # Determine if all passed
-    passed_match = _PASSED_PATTERN.search(combined)
+    passed_count = markers.get("passed")
     all_passed = (
-        passed_match is not None
-        and not failed_match
+        passed_count is not None
+        and not failed_count
         and not error_types
-        and not error_count_match
+        and not error_count
     )
 
     # tests_ran is True if we have passed/failed/error
     tests_ran = bool(
-        passed_match
-        or failed_match
+        passed_count
+        or failed_count
         or error_types
-        or error_count_match,
+        or error_count,
     )
 
     return ParsedTestResult(
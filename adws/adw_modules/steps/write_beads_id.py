@@ -13,6 +13,21 @@ from adws.adw_modules import io_ops
 from adws.adw_modules.errors import PipelineError
 from adws.adw_modules.types import BmadStory, WorkflowContext
 
+_BEADS_ID_LINE_PATTERN = re.compile(r"^beads_id:.*$", re.MULTILINE)
+
+
+def _split_front_matter(content: str) -> tuple[str, int] | None:
+    """Return (front matter, offset just past the closing fence).
+
+    Returns None when there is no complete front matter block.
+    """
+    if not content.startswith("---"):
+        return None
+    end = content.find("\n---", 3)
+    if end == -1:
+        return None
+    return content[3:end], end + 4
+
 
 def _has_beads_id(markdown: str) -> bool:
     """Check if markdown front matter contains a beads_id line.
@@ -21,14 +36,9 @@ def _has_beads_id(markdown: str) -> bool:
     ``---`` at position 0 and closing ``\\n---`` on its own
     line). Does NOT detect beads_id in the body.
     """
-    if not markdown.startswith("---"):
-        return False
-    end = markdown.find("\n---", 3)
-    if end == -1:
-        return False
-    front_matter = markdown[3:end]
+    split = _split_front_matter(markdown)
     return bool(
-        re.search(r"^beads_id:", front_matter, re.MULTILINE),
+        split and _BEADS_ID_LINE_PATTERN.search(split[0]),
     )
 
 
@@ -42,31 +52,18 @@ def _inject_beads_id(
     If front matter exists without beads_id, adds it before
     the closing ``---``. If no front matter exists, prepends one.
     """
-    if not content:
-        return f"---\nbeads_id: {beads_id}\n---\n"
-
-    if not content.startswith("---"):
+    split = _split_front_matter(content)
+    if split is None:
         return f"---\nbeads_id: {beads_id}\n---\n{content}"
 
-    end = content.find("\n---", 3)
-    if end == -1:
-        return f"---\nbeads_id: {beads_id}\n---\n{content}"
-
-    front_matter = content[3:end]
-    rest = content[end + 4:]
-
     # Replace existing beads_id or add new one
-    if re.search(r"^beads_id:", front_matter, re.MULTILINE):
-        front_matter = re.sub(
-            r"^beads_id:.*$",
-            f"beads_id: {beads_id}",
-            front_matter,
-            flags=re.MULTILINE,
-        )
-    else:
+    front_matter, replaced = _BEADS_ID_LINE_PATTERN.subn(
+        f"beads_id: {beads_id}", split[0],
+    )
+    if not replaced:
         front_matter = front_matter + f"\nbeads_id: {beads_id}"
 
-    return f"---{front_matter}\n---{rest}"
+    return f"---{front_matter}\n---{content[split[1]:]}"
 
 
 def write_beads_id(
@@ -96,19 +96,16 @@ def _extract_test_files(
     """Extract test file paths from SDK response.
 
     Pure function: uses regex to find adws/tests/ paths.
-    Returns deduplicated list. Handles None result gracefully.
+    Returns deduplicated list preserving insertion order.
+    Handles None result gracefully.
     """
-    if response.result is None:
+    text = response.result
+    if not text:
         return []
 
-    matches = _TEST_FILE_PATTERN.findall(response.result)
-    seen: set[str] = set()
-    result: list[str] = []
-    for match in matches:
-        if match not in seen:
-            seen.add(match)
-            result.append(match)
-    return result
+    return list(
+        dict.fromkeys(_TEST_FILE_PATTERN.findall(text)),
+    )
 
 
 def _process_sdk_response(
@@ -4,6 +4,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from typing import TYPE_CHECKING
 
+import pytest
 from returns.io import IOFailure, IOResult, IOSuccess
 from returns.unsafe import unsafe_perform_io
 
@@ -12,6 +13,7 @@ from adws.adw_modules.engine.combinators import (
     with_verification,
 )
 from adws.adw_modules.engine.executor import (
+    _STEP_REGISTRY,
     _resolve_input_from,
     _resolve_step_function,
     _run_step_with_retry,
@@ -213,6 +215,11 @@ class TestResolveStepFunction:
         resolved_fn = unsafe_perform_io(result.unwrap())
         assert resolved_fn is create_beads_issue
 
+    def test_step_registry_is_read_only(self) -> None:
+        """Registry cannot be mutated after import."""
+        with pytest.raises(TypeError):
+            _STEP_REGISTRY["injected"] = check_sdk_available  # type: ignore[index]
+
 
 # --- Task 1: run_step tests ---
 
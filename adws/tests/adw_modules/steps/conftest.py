@@ -0,0 +1,69 @@
+"""Shared fixtures for step function tests."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from adws.adw_modules.types import WorkflowContext
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from unittest.mock import MagicMock
+
+    from pytest_mock import MockerFixture
+
+    PatchIo = Callable[[str, str, object], MagicMock]
+
+# Test modules import _ok/_err from here; rewrite their asserts so
+# a failed unwrap reports the actual IOResult.
+pytest.register_assert_rewrite("adws.tests.adw_modules.steps.results")
+
+
+@pytest.fixture(scope="module")
+def story_ctx() -> WorkflowContext:
+    """Shared context carrying only an issue description.
+
+    The dataclass is frozen but ``inputs`` is a plain dict, so
+    tests derive new contexts with ``with_updates`` and never
+    mutate this one.
+    """
+    return WorkflowContext(
+        inputs={"issue_description": "Test story"},
+    )
+
+
+@pytest.fixture(scope="module")
+def base_track_inputs() -> dict[str, object]:
+    """Complete inputs for the file-tracking steps.
+
+    Tests derive their inputs with ``{**base_track_inputs, ...}``
+    or a filtering comprehension, never by mutating this dict.
+    """
+    return {
+        "file_path": "/some/file.py",
+        "operation": "read",
+        "session_id": "sess-1",
+        "hook_name": "file_tracker",
+    }
+
+
+@pytest.fixture
+def patch_io(mocker: MockerFixture) -> PatchIo:
+    """Return a factory that patches an I/O call seen by a step.
+
+    ``io_call`` is resolved on the step module: pass
+    ``"io_ops.<name>"`` for steps that import io_ops, or the
+    bare name for steps that import the function directly.
+    """
+    def _patch(
+        step_module: str,
+        io_call: str,
+        return_value: object,
+    ) -> MagicMock:
+        return mocker.patch(
+            f"adws.adw_modules.steps.{step_module}.{io_call}",
+            return_value=return_value,
+        )
+
+    return _patch
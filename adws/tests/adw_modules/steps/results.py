@@ -0,0 +1,34 @@
+"""IOResult unwrap helpers shared by the step function tests."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from returns.io import IOFailure, IOSuccess
+from returns.unsafe import unsafe_perform_io
+
+if TYPE_CHECKING:
+    from returns.io import IOResult
+
+    from adws.adw_modules.errors import PipelineError
+    from adws.adw_modules.types import WorkflowContext
+
+
+def _ok(
+    result: IOResult[WorkflowContext, PipelineError],
+) -> Any:
+    """Assert IOSuccess and return the wrapped context.
+
+    Typed Any like an isinstance-narrowed unwrap, so tests can
+    index the untyped ``outputs`` values directly.
+    """
+    assert isinstance(result, IOSuccess)
+    return unsafe_perform_io(result.unwrap())
+
+
+def _err(
+    result: IOResult[WorkflowContext, PipelineError],
+) -> PipelineError:
+    """Assert IOFailure and return the wrapped error."""
+    assert isinstance(result, IOFailure)
+    error: PipelineError = unsafe_perform_io(result.failure())
+    return error
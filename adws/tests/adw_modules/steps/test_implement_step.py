@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 from returns.io import IOFailure, IOSuccess
 from returns.unsafe import unsafe_perform_io
 
+from adws.adw_modules import io_ops
 from adws.adw_modules.engine.executor import _STEP_REGISTRY
 from adws.adw_modules.errors import PipelineError
 from adws.adw_modules.steps import (
@@ -199,6 +200,47 @@ class TestBuildGreenPhaseRequest:
         assert "adws/tests/test_foo.py" in request.prompt
         assert "adws/tests/test_bar.py" in request.prompt
 
+    def test_build_green_phase_request_independent_prompts(
+        self,
+    ) -> None:
+        """Successive requests do not share prompt state."""
+        first = _build_green_phase_request(
+            WorkflowContext(
+                inputs={"issue_description": "First story"},
+            ),
+        )
+        second = _build_green_phase_request(
+            WorkflowContext(
+                inputs={"issue_description": "Second story"},
+            ),
+        )
+
+        assert "First story" in first.prompt
+        assert "First story" not in second.prompt
+        assert "Second story" in second.prompt
+        assert first.system_prompt == second.system_prompt
+
+    def test_build_green_phase_request_section_layout(
+        self,
+    ) -> None:
+        """Sections appear in order, separated by blank lines."""
+        ctx = WorkflowContext(
+            inputs={
+                "issue_description": "Some story",
+                "test_files": ["adws/tests/test_foo.py"],
+            },
+            feedback=["Previous attempt: AssertionError"],
+        )
+        request = _build_green_phase_request(ctx)
+
+        assert request.prompt.endswith(
+            "Some story\n\n"
+            "## Test Files to Make Pass\n"
+            "adws/tests/test_foo.py\n\n"
+            "## Previous Feedback\n"
+            "Previous attempt: AssertionError",
+        )
+
 
 # --- Task 3: _extract_implementation_files tests ---
 
@@ -270,6 +312,27 @@ class TestExtractImplementationFiles:
 
         assert files == []
 
+    def test_extract_implementation_files_empty_result(
+        self,
+    ) -> None:
+        """Returns empty list when result is an empty string."""
+        response = AdwsResponse(result="", is_error=False)
+        files = _extract_implementation_files(response)
+
+        assert files == []
+
+    def test_extract_implementation_files_prefix_without_py(
+        self,
+    ) -> None:
+        """Prefix present but no .py path still yields nothing."""
+        response = AdwsResponse(
+            result="Looked in adws/adw_modules/ only",
+            is_error=False,
+        )
+        files = _extract_implementation_files(response)
+
+        assert files == []
+
     def test_extract_implementation_files_deduplication(
         self,
     ) -> None:
@@ -373,11 +436,11 @@ class TestImplementStep:
     def test_implement_step_success(
         self,
         mocker: MockerFixture,
+        story_ctx: WorkflowContext,
     ) -> None:
         """Success: SDK returns valid response."""
-        mock_sdk = mocker.patch(
-            "adws.adw_modules.steps.implement_step"
-            ".io_ops.execute_sdk_call",
+        mock_sdk = mocker.patch.object(
+            io_ops, "execute_sdk_call",
             return_value=IOSuccess(
                 AdwsResponse(
                     result=(
@@ -389,12 +452,7 @@ class TestImplementStep:
             ),
         )
 
-        ctx = WorkflowContext(
-            inputs={
-                "issue_description": "Test story",
-            },
-        )
-        result = implement_step(ctx)
+        result = implement_step(story_ctx)
 
         assert isinstance(result, IOSuccess)
         updated = unsafe_perform_io(result.unwrap())
@@ -412,11 +470,11 @@ class TestImplementStep:
     def test_implement_step_sdk_failure(
         self,
         mocker: MockerFixture,
+        story_ctx: WorkflowContext,
     ) -> None:
         """SDK call returns IOFailure -- propagated."""
-        mocker.patch(
-            "adws.adw_modules.steps.implement_step"
-            ".io_ops.execute_sdk_call",
+        mocker.patch.object(
+            io_ops, "execute_sdk_call",
             return_value=IOFailure(
                 PipelineError(
                     step_name="io_ops.execute_sdk_call",
@@ -426,12 +484,7 @@ class TestImplementStep:
             ),
         )
 
-        ctx = WorkflowContext(
-            inputs={
-                "issue_description": "Test story",
-            },
-        )
-        result = implement_step(ctx)
+        result = implement_step(story_ctx)
 
         assert isinstance(result, IOFailure)
         err = unsafe_perform_io(result.failure())
@@ -441,11 +494,11 @@ class TestImplementStep:
     def test_implement_step_sdk_error_response(
         self,
         mocker: MockerFixture,
+        story_ctx: WorkflowContext,
     ) -> None:
         """SDK returns success IOResult but is_error=True."""
-        mocker.patch(
-            "adws.adw_modules.steps.implement_step"
-            ".io_ops.execute_sdk_call",
+        mocker.patch.object(
+            io_ops, "execute_sdk_call",
             return_value=IOSuccess(
                 AdwsResponse(
                     result=None,
@@ -455,12 +508,7 @@ class TestImplementStep:
             ),
         )
 
-        ctx = WorkflowContext(
-            inputs={
-                "issue_description": "Test story",
-            },
-        )
-        result = implement_step(ctx)
+        result = implement_step(story_ctx)
 
         assert isinstance(result, IOFailure)
         err = unsafe_perform_io(result.failure())
@@ -471,11 +519,11 @@ class TestImplementStep:
     def test_implement_step_empty_implementation_files(
         self,
         mocker: MockerFixture,
+        story_ctx: WorkflowContext,
     ) -> None:
         """Success even when no impl files extracted."""
-        mocker.patch(
-            "adws.adw_modules.steps.implement_step"
-            ".io_ops.execute_sdk_call",
+        mocker.patch.object(
+            io_ops, "execute_sdk_call",
             return_value=IOSuccess(
                 AdwsResponse(
                     result="Done but no paths listed",
@@ -484,12 +532,7 @@ class TestImplementStep:
             ),
         )
 
-        ctx = WorkflowContext(
-            inputs={
-                "issue_description": "Test story",
-            },
-        )
-        result = implement_step(ctx)
+        result = implement_step(story_ctx)
 
         assert isinstance(result, IOSuccess)
         updated = unsafe_perform_io(result.unwrap())
@@ -534,9 +577,8 @@ class TestImplementStepIntegration:
         mocker: MockerFixture,
     ) -> None:
         """Full flow: description + feedback -> success."""
-        mock_sdk = mocker.patch(
-            "adws.adw_modules.steps.implement_step"
-            ".io_ops.execute_sdk_call",
+        mock_sdk = mocker.patch.object(
+            io_ops, "execute_sdk_call",
             return_value=IOSuccess(
                 AdwsResponse(
                     result=(
@@ -596,11 +638,11 @@ class TestImplementStepIntegration:
     def test_integration_sdk_failure(
         self,
         mocker: MockerFixture,
+        story_ctx: WorkflowContext,
     ) -> None:
         """SDK failure propagates with correct step_name."""
-        mocker.patch(
-            "adws.adw_modules.steps.implement_step"
-            ".io_ops.execute_sdk_call",
+        mocker.patch.object(
+            io_ops, "execute_sdk_call",
             return_value=IOFailure(
                 PipelineError(
                     step_name="io_ops.execute_sdk_call",
@@ -610,12 +652,7 @@ class TestImplementStepIntegration:
             ),
         )
 
-        ctx = WorkflowContext(
-            inputs={
-                "issue_description": "A story",
-            },
-        )
-        result = implement_step(ctx)
+        result = implement_step(story_ctx)
 
         assert isinstance(result, IOFailure)
         err = unsafe_perform_io(result.failure())
@@ -624,11 +661,11 @@ class TestImplementStepIntegration:
     def test_integration_sdk_error_response(
         self,
         mocker: MockerFixture,
+        story_ctx: WorkflowContext,
     ) -> None:
         """SDK error response (is_error=True) propagates."""
-        mocker.patch(
-            "adws.adw_modules.steps.implement_step"
-            ".io_ops.execute_sdk_call",
+        mocker.patch.object(
+            io_ops, "execute_sdk_call",
             return_value=IOSuccess(
                 AdwsResponse(
                     result=None,
@@ -638,12 +675,7 @@ class TestImplementStepIntegration:
             ),
         )
 
-        ctx = WorkflowContext(
-            inputs={
-                "issue_description": "A story",
-            },
-        )
-        result = implement_step(ctx)
+        result = implement_step(story_ctx)
 
         assert isinstance(result, IOFailure)
         err = unsafe_perform_io(result.failure())
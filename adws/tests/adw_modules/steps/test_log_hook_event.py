@@ -1,11 +1,14 @@
 """Tests for log_hook_event and log_hook_event_safe steps."""
 from __future__ import annotations
 
+import json
+from datetime import datetime
 from typing import TYPE_CHECKING
 
 from returns.io import IOFailure, IOSuccess
 from returns.unsafe import unsafe_perform_io
 
+from adws.adw_modules import io_ops
 from adws.adw_modules.errors import PipelineError
 from adws.adw_modules.steps.log_hook_event import (
     log_hook_event,
@@ -24,9 +27,8 @@ def test_log_hook_event_success(
     mocker: MockerFixture,
 ) -> None:
     """log_hook_event constructs HookEvent and writes log."""
-    mock_write = mocker.patch(
-        "adws.adw_modules.steps.log_hook_event.io_ops"
-        ".write_hook_log",
+    mock_write = mocker.patch.object(
+        io_ops, "write_hook_log",
         return_value=IOSuccess(None),
     )
     ctx = WorkflowContext(
@@ -96,9 +98,8 @@ def test_log_hook_event_missing_session_id(
     mocker: MockerFixture,
 ) -> None:
     """log_hook_event generates fallback session_id when missing."""
-    mock_write = mocker.patch(
-        "adws.adw_modules.steps.log_hook_event.io_ops"
-        ".write_hook_log",
+    mock_write = mocker.patch.object(
+        io_ops, "write_hook_log",
         return_value=IOSuccess(None),
     )
     ctx = WorkflowContext(
@@ -112,15 +113,18 @@ def test_log_hook_event_missing_session_id(
     call_args = mock_write.call_args
     session_id = call_args[0][0]
     assert session_id.startswith("unknown-")
+    # Fallback id and event timestamp come from one clock read
+    event = json.loads(call_args[0][1])
+    stamp = datetime.fromisoformat(event["timestamp"])
+    assert session_id == f"unknown-{stamp:%Y%m%d%H%M%S}"
 
 
 def test_log_hook_event_missing_payload(
     mocker: MockerFixture,
 ) -> None:
     """log_hook_event defaults to empty dict when payload missing."""
-    mock_write = mocker.patch(
-        "adws.adw_modules.steps.log_hook_event.io_ops"
-        ".write_hook_log",
+    mock_write = mocker.patch.object(
+        io_ops, "write_hook_log",
         return_value=IOSuccess(None),
     )
     ctx = WorkflowContext(
@@ -145,9 +149,8 @@ def test_log_hook_event_io_failure(
         error_type="HookLogWriteError",
         message="disk full",
     )
-    mocker.patch(
-        "adws.adw_modules.steps.log_hook_event.io_ops"
-        ".write_hook_log",
+    mocker.patch.object(
+        io_ops, "write_hook_log",
         return_value=IOFailure(io_error),
     )
     ctx = WorkflowContext(
@@ -171,9 +174,8 @@ def test_log_hook_event_safe_success_passthrough(
     mocker: MockerFixture,
 ) -> None:
     """log_hook_event_safe passes through IOSuccess."""
-    mocker.patch(
-        "adws.adw_modules.steps.log_hook_event.io_ops"
-        ".write_hook_log",
+    mocker.patch.object(
+        io_ops, "write_hook_log",
         return_value=IOSuccess(None),
     )
     ctx = WorkflowContext(
@@ -198,14 +200,12 @@ def test_log_hook_event_safe_catches_failure(
         error_type="HookLogWriteError",
         message="disk full",
     )
-    mocker.patch(
-        "adws.adw_modules.steps.log_hook_event.io_ops"
-        ".write_hook_log",
+    mocker.patch.object(
+        io_ops, "write_hook_log",
         return_value=IOFailure(io_error),
     )
-    mock_stderr = mocker.patch(
-        "adws.adw_modules.steps.log_hook_event.io_ops"
-        ".write_stderr",
+    mock_stderr = mocker.patch.object(
+        io_ops, "write_stderr",
         return_value=IOSuccess(None),
     )
     ctx = WorkflowContext(
@@ -232,9 +232,8 @@ def test_log_hook_event_safe_double_failure(
         error_type="HookLogWriteError",
         message="disk full",
     )
-    mocker.patch(
-        "adws.adw_modules.steps.log_hook_event.io_ops"
-        ".write_hook_log",
+    mocker.patch.object(
+        io_ops, "write_hook_log",
         return_value=IOFailure(io_error),
     )
     stderr_error = PipelineError(
@@ -242,9 +241,8 @@ def test_log_hook_event_safe_double_failure(
         error_type="StderrWriteError",
         message="broken pipe",
     )
-    mocker.patch(
-        "adws.adw_modules.steps.log_hook_event.io_ops"
-        ".write_stderr",
+    mocker.patch.object(
+        io_ops, "write_stderr",
         return_value=IOFailure(stderr_error),
     )
     ctx = WorkflowContext(
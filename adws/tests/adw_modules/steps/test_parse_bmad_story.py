@@ -1,12 +1,14 @@
 """Tests for parse_bmad_story step and private helpers."""
 from __future__ import annotations
 
+import importlib
 from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
 
 import pytest
 from returns.io import IOFailure, IOSuccess
-from returns.unsafe import unsafe_perform_io
 
+from adws.adw_modules import io_ops
 from adws.adw_modules.errors import PipelineError
 from adws.adw_modules.steps.parse_bmad_story import (
     _generate_slug,
@@ -22,194 +24,180 @@ from adws.adw_modules.types import (
     BmadStory,
     WorkflowContext,
 )
+from adws.tests.adw_modules.steps.results import _err, _ok
 
 if TYPE_CHECKING:
-    from pytest_mock import MockerFixture
-
-
-# --- _generate_slug tests ---
+    from collections.abc import Iterator
 
+# The steps package re-exports the parse_bmad_story *function*
+# under the submodule's name, so fetch the module object itself
+# once for attribute patching.
+_pbs_module = importlib.import_module(
+    "adws.adw_modules.steps.parse_bmad_story",
+)
 
-class TestGenerateSlug:
-    """Tests for _generate_slug helper."""
 
-    def test_basic_slug(self) -> None:
-        """Standard title produces correct slug."""
-        result = _generate_slug(6, 1, "BMAD Markdown Parser")
-        assert result == "6-1-bmad-markdown-parser"
+def _ctx(bmad_file_path: object) -> WorkflowContext:
+    """Return a context whose only input is bmad_file_path."""
+    return WorkflowContext(inputs={"bmad_file_path": bmad_file_path})
 
-    def test_slug_with_special_characters(self) -> None:
-        """Special characters are replaced with hyphens."""
-        result = _generate_slug(
-            6, 3,
-            "Bidirectional Tracking & /convert-stories-to-beads Command",
-        )
-        assert result == (
-            "6-3-bidirectional-tracking-convert-stories-to-beads-command"
-        )
-
-    def test_slug_with_ampersand(self) -> None:
-        """Ampersand is replaced with hyphen."""
-        result = _generate_slug(
-            1, 1, "Project Scaffold & Dual-Toolchain Setup",
-        )
-        assert result == (
-            "1-1-project-scaffold-dual-toolchain-setup"
-        )
-
-    def test_slug_collapses_hyphens(self) -> None:
-        """Multiple consecutive hyphens collapse to one."""
-        result = _generate_slug(1, 1, "A -- B")
-        assert result == "1-1-a-b"
-
-    def test_slug_strips_leading_trailing_hyphens(self) -> None:
-        """Leading and trailing hyphens are stripped."""
-        result = _generate_slug(1, 1, "  Title  ")
-        assert result == "1-1-title"
-
-    def test_slug_mixed_case(self) -> None:
-        """Mixed case converts to lowercase."""
-        result = _generate_slug(2, 1, "Error Types & WorkflowContext")
-        assert result == (
-            "2-1-error-types-workflowcontext"
-        )
 
-    def test_slug_with_parentheses(self) -> None:
-        """Parentheses are removed/replaced."""
-        result = _generate_slug(
-            4, 4, "Build Command & implement_close Workflow",
-        )
-        assert "(" not in result
-        assert ")" not in result
+# --- _generate_slug tests ---
 
-    def test_slug_with_underscores(self) -> None:
-        """Underscores in title are converted to hyphens."""
-        result = _generate_slug(
-            4, 4, "Build Command & implement_close Workflow",
-        )
-        assert result == (
-            "4-4-build-command-implement-close-workflow"
-        )
+_SLUG_CASES: list[tuple[int, int, str, str]] = [
+    (6, 1, "BMAD Markdown Parser", "6-1-bmad-markdown-parser"),
+    (
+        6, 3,
+        "Bidirectional Tracking & /convert-stories-to-beads Command",
+        "6-3-bidirectional-tracking-convert-stories-to-beads-command",
+    ),
+    (
+        1, 1, "Project Scaffold & Dual-Toolchain Setup",
+        "1-1-project-scaffold-dual-toolchain-setup",
+    ),
+    (1, 1, "A -- B", "1-1-a-b"),
+    (1, 1, "  Title  ", "1-1-title"),
+    (
+        2, 1, "Error Types & WorkflowContext",
+        "2-1-error-types-workflowcontext",
+    ),
+    (
+        4, 4, "Build Command (implement_close) Workflow",
+        "4-4-build-command-implement-close-workflow",
+    ),
+    (
+        4, 4, "Build Command & implement_close Workflow",
+        "4-4-build-command-implement-close-workflow",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    ("epic_number", "story_number", "title", "expected"),
+    _SLUG_CASES,
+)
+def test_generate_slug(
+    epic_number: int,
+    story_number: int,
+    title: str,
+    expected: str,
+) -> None:
+    """Title is lowercased, non-alphanumerics become single hyphens."""
+    assert _generate_slug(epic_number, story_number, title) == expected
 
 
 # --- _strip_front_matter tests ---
 
-
-class TestStripFrontMatter:
-    """Tests for _strip_front_matter helper."""
-
-    def test_strips_yaml_front_matter(self) -> None:
-        """YAML front matter is removed."""
-        content = (
-            "---\nstatus: complete\n---\n\n# Title\n\nContent"
-        )
-        result = _strip_front_matter(content)
-        assert result.startswith("# Title")
-        assert "status: complete" not in result
-
-    def test_no_front_matter(self) -> None:
-        """Content without front matter passes through."""
-        content = "# Title\n\nContent"
-        result = _strip_front_matter(content)
-        assert result == content
-
-    def test_unclosed_front_matter(self) -> None:
-        """Unclosed front matter returns original content."""
-        content = "---\nstatus: complete\n# Title"
-        result = _strip_front_matter(content)
-        assert result == content
-
-    def test_front_matter_with_dashes_in_value(self) -> None:
-        """Dashes inside YAML values are not treated as delimiters."""
-        content = (
-            "---\n"
-            "description: use --- to separate\n"
-            "---\n\n"
-            "# Title\n\nContent"
-        )
-        result = _strip_front_matter(content)
-        assert result.startswith("# Title")
-        assert "description" not in result
+_FRONT_MATTER_CASES: list[tuple[str, str]] = [
+    (
+        "---\nstatus: complete\n---\n\n# Title\n\nContent",
+        "# Title\n\nContent",
+    ),
+    ("# Title\n\nContent", "# Title\n\nContent"),
+    (
+        "---\nstatus: complete\n# Title",
+        "---\nstatus: complete\n# Title",
+    ),
+    (
+        "---\n"
+        "description: use --- to separate\n"
+        "---\n\n"
+        "# Title\n\nContent",
+        "# Title\n\nContent",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    _FRONT_MATTER_CASES,
+    ids=[
+        "strips-yaml",
+        "no-front-matter",
+        "unclosed-returns-original",
+        "dashes-in-value",
+    ],
+)
+def test_strip_front_matter(content: str, expected: str) -> None:
+    """Front matter is removed only when closed on its own line."""
+    assert _strip_front_matter(content) == expected
 
 
 # --- _split_into_epic_sections tests ---
 
-
-class TestSplitIntoEpicSections:
-    """Tests for _split_into_epic_sections helper."""
-
-    def test_splits_multiple_epics(self) -> None:
-        """Multiple epics are split correctly."""
-        markdown = (
-            "## Epic List\n\n"
-            "### Epic 1: Foundation\n\nDesc 1\n\n"
-            "---\n\n"
-            "### Epic 2: Engine\n\nDesc 2\n"
-        )
-        sections = _split_into_epic_sections(markdown)
-        assert len(sections) == 2
-        assert "Epic 1:" in sections[0]
-        assert "Epic 2:" in sections[1]
-
-    def test_single_epic(self) -> None:
-        """Single epic returns a list with one element."""
-        markdown = "### Epic 1: Foundation\n\nDesc 1\n"
-        sections = _split_into_epic_sections(markdown)
-        assert len(sections) == 1
-        assert "Epic 1:" in sections[0]
-
-    def test_filters_non_epic_sections(self) -> None:
-        """Non-epic ### sections are excluded."""
-        markdown = (
-            "### Epic 1: Foundation\n\nDesc 1\n\n"
-            "---\n\n"
-            "### Dependency & Parallelism Map\n\nNot an epic\n"
-        )
-        sections = _split_into_epic_sections(markdown)
-        assert len(sections) == 1
-        assert "Epic 1:" in sections[0]
-        assert "Dependency" not in sections[0]
-
-    def test_no_epics(self) -> None:
-        """Content with no epics returns empty list."""
-        markdown = "# Title\n\n## Overview\n\nSome text"
-        sections = _split_into_epic_sections(markdown)
-        assert sections == []
+_EPIC_SECTION_CASES: list[tuple[str, list[str]]] = [
+    (
+        "## Epic List\n\n"
+        "### Epic 1: Foundation\n\nDesc 1\n\n"
+        "---\n\n"
+        "### Epic 2: Engine\n\nDesc 2\n",
+        [
+            "### Epic 1: Foundation\n\nDesc 1\n\n---",
+            "### Epic 2: Engine\n\nDesc 2",
+        ],
+    ),
+    (
+        "### Epic 1: Foundation\n\nDesc 1\n",
+        ["### Epic 1: Foundation\n\nDesc 1"],
+    ),
+    (
+        "### Epic 1: Foundation\n\nDesc 1\n\n"
+        "---\n\n"
+        "### Dependency & Parallelism Map\n\nNot an epic\n",
+        ["### Epic 1: Foundation\n\nDesc 1\n\n---"],
+    ),
+    ("# Title\n\n## Overview\n\nSome text", []),
+]
+
+
+@pytest.mark.parametrize(
+    ("markdown", "expected"),
+    _EPIC_SECTION_CASES,
+    ids=[
+        "multiple-epics",
+        "single-epic",
+        "filters-non-epic-sections",
+        "no-epics",
+    ],
+)
+def test_split_into_epic_sections(
+    markdown: str, expected: list[str],
+) -> None:
+    """Only ``### Epic N:`` sections are kept, stripped."""
+    assert _split_into_epic_sections(markdown) == expected
 
 
 # --- _split_into_story_blocks tests ---
 
-
-class TestSplitIntoStoryBlocks:
-    """Tests for _split_into_story_blocks helper."""
-
-    def test_splits_multiple_stories(self) -> None:
-        """Multiple stories are split correctly."""
-        section = (
-            "### Epic 1: Foundation\n\nDesc\n\n"
-            "#### Story 1.1: Setup\n\nStory 1\n\n"
-            "#### Story 1.2: Config\n\nStory 2\n"
-        )
-        blocks = _split_into_story_blocks(section)
-        assert len(blocks) == 2
-        assert "Story 1.1:" in blocks[0]
-        assert "Story 1.2:" in blocks[1]
-
-    def test_single_story(self) -> None:
-        """Single story returns list with one element."""
-        section = (
-            "### Epic 1: Foundation\n\nDesc\n\n"
-            "#### Story 1.1: Setup\n\nStory content\n"
-        )
-        blocks = _split_into_story_blocks(section)
-        assert len(blocks) == 1
-        assert "Story 1.1:" in blocks[0]
-
-    def test_no_stories(self) -> None:
-        """Epic with no stories returns empty list."""
-        section = "### Epic 1: Foundation\n\nJust a description\n"
-        blocks = _split_into_story_blocks(section)
-        assert blocks == []
+_STORY_BLOCK_CASES: list[tuple[str, list[str]]] = [
+    (
+        "### Epic 1: Foundation\n\nDesc\n\n"
+        "#### Story 1.1: Setup\n\nStory 1\n\n"
+        "#### Story 1.2: Config\n\nStory 2\n",
+        [
+            "#### Story 1.1: Setup\n\nStory 1",
+            "#### Story 1.2: Config\n\nStory 2",
+        ],
+    ),
+    (
+        "### Epic 1: Foundation\n\nDesc\n\n"
+        "#### Story 1.1: Setup\n\nStory content\n",
+        ["#### Story 1.1: Setup\n\nStory content"],
+    ),
+    ("### Epic 1: Foundation\n\nJust a description\n", []),
+]
+
+
+@pytest.mark.parametrize(
+    ("section", "expected"),
+    _STORY_BLOCK_CASES,
+    ids=["multiple-stories", "single-story", "no-stories"],
+)
+def test_split_into_story_blocks(
+    section: str, expected: list[str],
+) -> None:
+    """Each ``#### Story N.M:`` block is split out, stripped."""
+    assert _split_into_story_blocks(section) == expected
 
 
 # --- _parse_epic_header tests ---
@@ -258,15 +246,15 @@ class TestParseEpicHeader:
         assert "important notes" not in desc.lower()
         assert "description paragraph" in desc.lower()
 
-    def test_invalid_header_raises(self) -> None:
+    @pytest.mark.parametrize(
+        "header",
+        ["### Not an epic format", "### Epic X: Bad Number"],
+        ids=["not-an-epic", "non-numeric-number"],
+    )
+    def test_invalid_header_raises(self, header: str) -> None:
         """Invalid epic header raises ValueError."""
         with pytest.raises(ValueError, match="Invalid epic header"):
-            _parse_epic_header("### Not an epic format")
-
-    def test_malformed_epic_number(self) -> None:
-        """Non-numeric epic number raises ValueError."""
-        with pytest.raises(ValueError, match="Invalid epic header"):
-            _parse_epic_header("### Epic X: Bad Number")
+            _parse_epic_header(header)
 
 
 # --- _parse_story_block tests ---
@@ -315,30 +303,39 @@ class TestParseStoryBlock:
         # Verify it's a copy, not the same list
         assert story.frs_covered is not epic_frs
 
-    def test_missing_user_story(self) -> None:
-        """Story without As a/I want/So that returns empty user_story."""
-        block = (
-            "#### Story 1.1: Setup\n\n"
-            "**Acceptance Criteria:**\n\n"
-            "**Given** setup\n"
-            "**When** run\n"
-            "**Then** works\n"
-        )
-        story = _parse_story_block(block, 1)
-        assert story.user_story == ""
-        assert "**Given**" in story.acceptance_criteria
-
-    def test_missing_acceptance_criteria(self) -> None:
-        """Story without AC section returns empty acceptance_criteria."""
-        block = (
-            "#### Story 1.1: Setup\n\n"
-            "As a developer,\n"
-            "I want setup,\n"
-            "So that it works.\n"
-        )
+    @pytest.mark.parametrize(
+        ("block", "user_story", "acceptance_criteria"),
+        [
+            (
+                "#### Story 1.1: Setup\n\n"
+                "**Acceptance Criteria:**\n\n"
+                "**Given** setup\n"
+                "**When** run\n"
+                "**Then** works\n",
+                "",
+                "**Given** setup\n**When** run\n**Then** works",
+            ),
+            (
+                "#### Story 1.1: Setup\n\n"
+                "As a developer,\n"
+                "I want setup,\n"
+                "So that it works.\n",
+                "As a developer,\nI want setup,\nSo that it works.",
+                "",
+            ),
+        ],
+        ids=["missing-user-story", "missing-acceptance-criteria"],
+    )
+    def test_missing_section_is_empty(
+        self,
+        block: str,
+        user_story: str,
+        acceptance_criteria: str,
+    ) -> None:
+        """A missing user story or AC section parses as empty."""
         story = _parse_story_block(block, 1)
-        assert story.acceptance_criteria == ""
-        assert "developer" in story.user_story
+        assert story.user_story == user_story
+        assert story.acceptance_criteria == acceptance_criteria
 
     def test_multiple_ac_blocks(self) -> None:
         """Multiple AC blocks are all captured."""
@@ -380,34 +377,138 @@ class TestParseStoryBlock:
 
 # --- parse_bmad_story step function tests ---
 
+_MD_SINGLE_EPIC = (
+    "### Epic 1: Foundation\n\n"
+    "Description.\n\n"
+    "**FRs covered:** FR41\n\n"
+    "#### Story 1.1: Setup\n\n"
+    "As a dev,\nI want setup,\nSo that it works.\n\n"
+    "**Acceptance Criteria:**\n\n"
+    "**Given** X\n**When** Y\n**Then** Z\n"
+)
+
+_MD_MULTI_EPIC = (
+    "### Epic 1: Foundation\n\n"
+    "Epic 1 desc.\n\n"
+    "**FRs covered:** FR41, FR42\n\n"
+    "#### Story 1.1: Setup\n\n"
+    "As a dev,\nI want setup,\nSo that ready.\n\n"
+    "**Acceptance Criteria:**\n\n"
+    "**Given** X\n**When** Y\n**Then** Z\n\n"
+    "#### Story 1.2: Config\n\n"
+    "As a dev,\nI want config,\nSo that works.\n\n"
+    "**Acceptance Criteria:**\n\n"
+    "**Given** A\n**When** B\n**Then** C\n\n"
+    "---\n\n"
+    "### Epic 2: Engine\n\n"
+    "Epic 2 desc.\n\n"
+    "**FRs covered:** FR1, FR2\n\n"
+    "#### Story 2.1: Core\n\n"
+    "As a dev,\nI want engine,\nSo that runs.\n\n"
+    "**Acceptance Criteria:**\n\n"
+    "**Given** P\n**When** Q\n**Then** R\n"
+)
+
+_MD_FRONT_MATTER = (
+    "---\nstatus: complete\n---\n\n# Title\n\n" + _MD_SINGLE_EPIC
+)
+
+_MD_EMPTY_AC = (
+    "### Epic 1: Foundation\n\n"
+    "Description.\n\n"
+    "**FRs covered:** FR41\n\n"
+    "#### Story 1.1: Setup\n\n"
+    "As a dev,\nI want setup,\nSo that works.\n\n"
+    "**Acceptance Criteria:**\n\n"
+)
+
+_MD_AC_ONLY = (
+    "### Epic 1: Foundation\n\n"
+    "Description.\n\n"
+    "**FRs covered:** FR41\n\n"
+    "#### Story 1.1: Setup\n\n"
+    "**Acceptance Criteria:**\n\n"
+    "**Given** X\n**When** Y\n**Then** Z\n"
+)
+
+_MD_NO_STORIES = (
+    "### Epic 1: Foundation\n\n"
+    "Description.\n\n"
+    "**FRs covered:** FR41\n"
+)
+
+_MD_NO_EPICS = "# Title\n\n## Overview\n\nSome text"
+
+_MD_BAD_EPIC_HEADER = "### Epic X: Missing Number\n\nDesc\n"
+
+_MD_BAD_STORY_HEADER = (
+    "### Epic 1: Foundation\n\n"
+    "Description.\n\n"
+    "**FRs covered:** FR41\n\n"
+    "#### Story X: Bad Number\n\nContent\n"
+)
+
+_HAPPY_CASES: list[tuple[str, str, int, int]] = [
+    ("single-epic", _MD_SINGLE_EPIC, 1, 1),
+    ("multi-epic", _MD_MULTI_EPIC, 2, 3),
+    ("front-matter", _MD_FRONT_MATTER, 1, 1),
+    ("empty-ac", _MD_EMPTY_AC, 1, 1),
+    ("ac-only", _MD_AC_ONLY, 1, 1),
+    ("no-stories", _MD_NO_STORIES, 1, 0),
+]
+
+_FILE_ERR = PipelineError(
+    step_name="io_ops.read_file",
+    error_type="FileNotFoundError",
+    message="File not found",
+)
+
+_PARSE_ERROR_CASES: list[tuple[str, str, str]] = [
+    ("empty", "", "empty"),
+    ("whitespace-only", "   \n\n  ", "empty"),
+    ("no-epics", _MD_NO_EPICS, "No epics"),
+    ("malformed-epic-header", _MD_BAD_EPIC_HEADER, "No epics"),
+    (
+        "malformed-story-header",
+        _MD_BAD_STORY_HEADER,
+        "Invalid story header",
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def _read_mock_module() -> Iterator[MagicMock]:
+    """Install one MagicMock as io_ops.read_bmad_file per module.
+
+    Module-scoped rather than session-scoped so the real reader
+    is restored before test_io_ops exercises it.
+    """
+    mock = MagicMock()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(io_ops, "read_bmad_file", mock)
+        yield mock
+
+
+@pytest.fixture(autouse=True)
+def read_mock(_read_mock_module: MagicMock) -> MagicMock:
+    """Hand each test the shared read_bmad_file mock, reset.
+
+    Tests set ``read_mock.return_value`` directly.
+    """
+    _read_mock_module.reset_mock(return_value=True, side_effect=True)
+    return _read_mock_module
+
 
 class TestParseBmadStory:
     """Tests for parse_bmad_story step function."""
 
     def test_single_epic_single_story(
-        self, mocker: MockerFixture,
+        self, read_mock: MagicMock,
     ) -> None:
         """Parses one epic with one story."""
-        md = (
-            "### Epic 1: Foundation\n\n"
-            "Description.\n\n"
-            "**FRs covered:** FR41\n\n"
-            "#### Story 1.1: Setup\n\n"
-            "As a dev,\nI want setup,\nSo that it works.\n\n"
-            "**Acceptance Criteria:**\n\n"
-            "**Given** X\n**When** Y\n**Then** Z\n"
-        )
-        mocker.patch(
-            "adws.adw_modules.steps.parse_bmad_story"
-            ".io_ops.read_bmad_file",
-            return_value=IOSuccess(md),
-        )
-        ctx = WorkflowContext(
-            inputs={"bmad_file_path": "epics.md"},
-        )
-        result = parse_bmad_story(ctx)
-        assert isinstance(result, IOSuccess)
-        out = unsafe_perform_io(result.unwrap())
+        read_mock.return_value = IOSuccess(_MD_SINGLE_EPIC)
+        result = parse_bmad_story(_ctx("epics.md"))
+        out = _ok(result)
         epics = out.outputs["parsed_epics"]
         stories = out.outputs["parsed_stories"]
         assert isinstance(epics, list)
@@ -418,43 +519,15 @@ class TestParseBmadStory:
         assert isinstance(stories[0], BmadStory)
         assert epics[0].epic_number == 1
         assert stories[0].story_number == 1
+        read_mock.assert_called_once_with("epics.md")
 
     def test_multi_epic_multi_story(
-        self, mocker: MockerFixture,
+        self, read_mock: MagicMock,
     ) -> None:
         """Parses multiple epics with multiple stories."""
-        md = (
-            "### Epic 1: Foundation\n\n"
-            "Epic 1 desc.\n\n"
-            "**FRs covered:** FR41, FR42\n\n"
-            "#### Story 1.1: Setup\n\n"
-            "As a dev,\nI want setup,\nSo that ready.\n\n"
-            "**Acceptance Criteria:**\n\n"
-            "**Given** X\n**When** Y\n**Then** Z\n\n"
-            "#### Story 1.2: Config\n\n"
-            "As a dev,\nI want config,\nSo that works.\n\n"
-            "**Acceptance Criteria:**\n\n"
-            "**Given** A\n**When** B\n**Then** C\n\n"
-            "---\n\n"
-            "### Epic 2: Engine\n\n"
-            "Epic 2 desc.\n\n"
-            "**FRs covered:** FR1, FR2\n\n"
-            "#### Story 2.1: Core\n\n"
-            "As a dev,\nI want engine,\nSo that runs.\n\n"
-            "**Acceptance Criteria:**\n\n"
-            "**Given** P\n**When** Q\n**Then** R\n"
-        )
-        mocker.patch(
-            "adws.adw_modules.steps.parse_bmad_story"
-            ".io_ops.read_bmad_file",
-            return_value=IOSuccess(md),
-        )
-        ctx = WorkflowContext(
-            inputs={"bmad_file_path": "epics.md"},
-        )
-        result = parse_bmad_story(ctx)
-        assert isinstance(result, IOSuccess)
-        out = unsafe_perform_io(result.unwrap())
+        read_mock.return_value = IOSuccess(_MD_MULTI_EPIC)
+        result = parse_bmad_story(_ctx("epics.md"))
+        out = _ok(result)
         epics = out.outputs["parsed_epics"]
         stories = out.outputs["parsed_stories"]
         assert len(epics) == 2
@@ -468,284 +541,120 @@ class TestParseBmadStory:
         assert stories[1].epic_number == 1
         assert stories[2].epic_number == 2
 
+    @pytest.mark.parametrize(
+        ("md", "epic_count", "story_count"),
+        [case[1:] for case in _HAPPY_CASES],
+        ids=[case[0] for case in _HAPPY_CASES],
+    )
+    def test_parsed_shape(
+        self,
+        read_mock: MagicMock,
+        md: str,
+        epic_count: int,
+        story_count: int,
+    ) -> None:
+        """Well-formed documents yield the expected epic/story counts."""
+        read_mock.return_value = IOSuccess(md)
+        result = parse_bmad_story(_ctx("epics.md"))
+        out = _ok(result)
+        epics = out.outputs["parsed_epics"]
+        stories = out.outputs["parsed_stories"]
+        assert len(epics) == epic_count
+        assert len(stories) == story_count
+        assert sum(len(e.stories) for e in epics) == story_count
+
+    def test_all_parse_failures(
+        self,
+        read_mock: MagicMock,
+        subtests: pytest.Subtests,
+    ) -> None:
+        """Read and parse failures all surface as IOFailure.
+
+        Runs every case under one fixture setup; each case is
+        reported as its own subtest.
+        """
+        # Rows: (id, read result, step_name, error_type, fragment).
+        # Read failures propagate the io_ops error unchanged.
+        cases: list[tuple[str, object, str, str, str]] = [
+            (
+                "file-read",
+                IOFailure(_FILE_ERR),
+                "io_ops.read_file",
+                "FileNotFoundError",
+                "File not found",
+            ),
+            *(
+                (
+                    case_id,
+                    IOSuccess(md),
+                    "parse_bmad_story",
+                    "ParseError",
+                    message_part,
+                )
+                for case_id, md, message_part in _PARSE_ERROR_CASES
+            ),
+        ]
+        for case_id, read_result, step_name, error_type, fragment in cases:
+            read_mock.return_value = read_result
+            with subtests.test(msg=case_id):
+                error = _err(parse_bmad_story(_ctx("bad.md")))
+                assert error.step_name == step_name
+                assert error.error_type == error_type
+                assert fragment in error.message
+
     def test_missing_bmad_file_path(self) -> None:
         """Returns IOFailure when bmad_file_path is missing."""
-        ctx = WorkflowContext(inputs={})
-        result = parse_bmad_story(ctx)
-        assert isinstance(result, IOFailure)
-        error = unsafe_perform_io(result.failure())
+        result = parse_bmad_story(WorkflowContext(inputs={}))
+        error = _err(result)
         assert error.error_type == "MissingInputError"
         assert error.step_name == "parse_bmad_story"
 
     def test_bmad_file_path_not_string(self) -> None:
         """Returns IOFailure when bmad_file_path is not a string."""
-        ctx = WorkflowContext(
-            inputs={"bmad_file_path": 42},
-        )
-        result = parse_bmad_story(ctx)
-        assert isinstance(result, IOFailure)
-        error = unsafe_perform_io(result.failure())
+        result = parse_bmad_story(_ctx(42))
+        error = _err(result)
         assert error.error_type == "MissingInputError"
 
     def test_bmad_file_path_empty_string(self) -> None:
         """Returns IOFailure when bmad_file_path is empty."""
-        ctx = WorkflowContext(
-            inputs={"bmad_file_path": ""},
-        )
-        result = parse_bmad_story(ctx)
-        assert isinstance(result, IOFailure)
-        error = unsafe_perform_io(result.failure())
+        result = parse_bmad_story(_ctx(""))
+        error = _err(result)
         assert error.error_type == "MissingInputError"
 
-    def test_file_read_failure(
-        self, mocker: MockerFixture,
-    ) -> None:
-        """Returns IOFailure when io_ops.read_bmad_file fails."""
-        file_err = PipelineError(
-            step_name="io_ops.read_file",
-            error_type="FileNotFoundError",
-            message="File not found",
-        )
-        mocker.patch(
-            "adws.adw_modules.steps.parse_bmad_story"
-            ".io_ops.read_bmad_file",
-            return_value=IOFailure(file_err),
-        )
-        ctx = WorkflowContext(
-            inputs={"bmad_file_path": "missing.md"},
-        )
-        result = parse_bmad_story(ctx)
-        assert isinstance(result, IOFailure)
-
-    def test_empty_file(
-        self, mocker: MockerFixture,
-    ) -> None:
-        """Returns IOFailure when file is empty."""
-        mocker.patch(
-            "adws.adw_modules.steps.parse_bmad_story"
-            ".io_ops.read_bmad_file",
-            return_value=IOSuccess(""),
-        )
-        ctx = WorkflowContext(
-            inputs={"bmad_file_path": "empty.md"},
-        )
-        result = parse_bmad_story(ctx)
-        assert isinstance(result, IOFailure)
-        error = unsafe_perform_io(result.failure())
-        assert error.error_type == "ParseError"
-        assert "empty" in error.message.lower()
-
-    def test_whitespace_only_file(
-        self, mocker: MockerFixture,
-    ) -> None:
-        """Returns IOFailure when file is whitespace only."""
-        mocker.patch(
-            "adws.adw_modules.steps.parse_bmad_story"
-            ".io_ops.read_bmad_file",
-            return_value=IOSuccess("   \n\n  "),
-        )
-        ctx = WorkflowContext(
-            inputs={"bmad_file_path": "blank.md"},
-        )
-        result = parse_bmad_story(ctx)
-        assert isinstance(result, IOFailure)
-        error = unsafe_perform_io(result.failure())
-        assert error.error_type == "ParseError"
-
-    def test_no_epics_found(
-        self, mocker: MockerFixture,
-    ) -> None:
-        """Returns IOFailure when no epics are found."""
-        mocker.patch(
-            "adws.adw_modules.steps.parse_bmad_story"
-            ".io_ops.read_bmad_file",
-            return_value=IOSuccess(
-                "# Title\n\n## Overview\n\nSome text"
-            ),
-        )
-        ctx = WorkflowContext(
-            inputs={"bmad_file_path": "no-epics.md"},
-        )
-        result = parse_bmad_story(ctx)
-        assert isinstance(result, IOFailure)
-        error = unsafe_perform_io(result.failure())
-        assert error.error_type == "ParseError"
-        assert "No epics" in error.message
-
-    def test_with_front_matter(
-        self, mocker: MockerFixture,
-    ) -> None:
-        """Front matter is skipped, parsing starts from content."""
-        md = (
-            "---\nstatus: complete\n---\n\n"
-            "# Title\n\n"
-            "### Epic 1: Foundation\n\n"
-            "Description.\n\n"
-            "**FRs covered:** FR41\n\n"
-            "#### Story 1.1: Setup\n\n"
-            "As a dev,\nI want setup,\nSo that works.\n\n"
-            "**Acceptance Criteria:**\n\n"
-            "**Given** X\n**When** Y\n**Then** Z\n"
-        )
-        mocker.patch(
-            "adws.adw_modules.steps.parse_bmad_story"
-            ".io_ops.read_bmad_file",
-            return_value=IOSuccess(md),
-        )
-        ctx = WorkflowContext(
-            inputs={"bmad_file_path": "epics.md"},
-        )
-        result = parse_bmad_story(ctx)
-        assert isinstance(result, IOSuccess)
-        out = unsafe_perform_io(result.unwrap())
-        assert len(out.outputs["parsed_epics"]) == 1
-
     def test_empty_ac_section(
-        self, mocker: MockerFixture,
+        self, read_mock: MagicMock,
     ) -> None:
         """Story with empty AC header is parsed with empty AC."""
-        md = (
-            "### Epic 1: Foundation\n\n"
-            "Description.\n\n"
-            "**FRs covered:** FR41\n\n"
-            "#### Story 1.1: Setup\n\n"
-            "As a dev,\nI want setup,\nSo that works.\n\n"
-            "**Acceptance Criteria:**\n\n"
-        )
-        mocker.patch(
-            "adws.adw_modules.steps.parse_bmad_story"
-            ".io_ops.read_bmad_file",
-            return_value=IOSuccess(md),
-        )
-        ctx = WorkflowContext(
-            inputs={"bmad_file_path": "epics.md"},
-        )
-        result = parse_bmad_story(ctx)
-        assert isinstance(result, IOSuccess)
-        out = unsafe_perform_io(result.unwrap())
+        read_mock.return_value = IOSuccess(_MD_EMPTY_AC)
+        result = parse_bmad_story(_ctx("epics.md"))
+        out = _ok(result)
         stories = out.outputs["parsed_stories"]
         assert stories[0].acceptance_criteria == ""
 
     def test_missing_user_story_with_ac(
-        self, mocker: MockerFixture,
+        self, read_mock: MagicMock,
     ) -> None:
         """Story missing user story but having AC is parsed correctly."""
-        md = (
-            "### Epic 1: Foundation\n\n"
-            "Description.\n\n"
-            "**FRs covered:** FR41\n\n"
-            "#### Story 1.1: Setup\n\n"
-            "**Acceptance Criteria:**\n\n"
-            "**Given** X\n**When** Y\n**Then** Z\n"
-        )
-        mocker.patch(
-            "adws.adw_modules.steps.parse_bmad_story"
-            ".io_ops.read_bmad_file",
-            return_value=IOSuccess(md),
-        )
-        ctx = WorkflowContext(
-            inputs={"bmad_file_path": "epics.md"},
-        )
-        result = parse_bmad_story(ctx)
-        assert isinstance(result, IOSuccess)
-        out = unsafe_perform_io(result.unwrap())
+        read_mock.return_value = IOSuccess(_MD_AC_ONLY)
+        result = parse_bmad_story(_ctx("epics.md"))
+        out = _ok(result)
         stories = out.outputs["parsed_stories"]
         assert stories[0].user_story == ""
         assert "**Given**" in stories[0].acceptance_criteria
 
-    def test_malformed_epic_header(
-        self, mocker: MockerFixture,
-    ) -> None:
-        """Returns ParseError for malformed epic header."""
-        md = "### Epic X: Missing Number\n\nDesc\n"
-        mocker.patch(
-            "adws.adw_modules.steps.parse_bmad_story"
-            ".io_ops.read_bmad_file",
-            return_value=IOSuccess(md),
-        )
-        ctx = WorkflowContext(
-            inputs={"bmad_file_path": "bad.md"},
-        )
-        result = parse_bmad_story(ctx)
-        assert isinstance(result, IOFailure)
-        error = unsafe_perform_io(result.failure())
-        assert error.error_type == "ParseError"
-
-    def test_malformed_story_header(
-        self, mocker: MockerFixture,
-    ) -> None:
-        """Returns ParseError for malformed story header."""
-        md = (
-            "### Epic 1: Foundation\n\n"
-            "Description.\n\n"
-            "**FRs covered:** FR41\n\n"
-            "#### Story X: Bad Number\n\nContent\n"
-        )
-        mocker.patch(
-            "adws.adw_modules.steps.parse_bmad_story"
-            ".io_ops.read_bmad_file",
-            return_value=IOSuccess(md),
-        )
-        ctx = WorkflowContext(
-            inputs={"bmad_file_path": "bad.md"},
-        )
-        result = parse_bmad_story(ctx)
-        assert isinstance(result, IOFailure)
-        error = unsafe_perform_io(result.failure())
-        assert error.error_type == "ParseError"
-
     def test_parse_story_block_raises_value_error(
-        self, mocker: MockerFixture,
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        read_mock: MagicMock,
     ) -> None:
         """Returns ParseError when _parse_story_block raises ValueError."""
-        md = (
-            "### Epic 1: Foundation\n\n"
-            "Description.\n\n"
-            "**FRs covered:** FR41\n\n"
-            "#### Story 1.1: Setup\n\n"
-            "As a dev,\nI want setup,\nSo that works.\n\n"
-            "**Acceptance Criteria:**\n\n"
-            "**Given** X\n**When** Y\n**Then** Z\n"
-        )
-        mocker.patch(
-            "adws.adw_modules.steps.parse_bmad_story"
-            ".io_ops.read_bmad_file",
-            return_value=IOSuccess(md),
-        )
-        mocker.patch(
-            "adws.adw_modules.steps.parse_bmad_story"
-            "._parse_story_block",
-            side_effect=ValueError("mock parse error"),
-        )
-        ctx = WorkflowContext(
-            inputs={"bmad_file_path": "epics.md"},
-        )
-        result = parse_bmad_story(ctx)
-        assert isinstance(result, IOFailure)
-        error = unsafe_perform_io(result.failure())
+        read_mock.return_value = IOSuccess(_MD_SINGLE_EPIC)
+        monkeypatch.setattr(
+            _pbs_module,
+            "_parse_story_block",
+            MagicMock(side_effect=ValueError("mock parse error")),
+        )
+        result = parse_bmad_story(_ctx("epics.md"))
+        error = _err(result)
         assert error.error_type == "ParseError"
         assert "mock parse error" in error.message
-
-    def test_epic_with_no_stories(
-        self, mocker: MockerFixture,
-    ) -> None:
-        """Epic with description but no stories produces empty stories list."""
-        md = (
-            "### Epic 1: Foundation\n\n"
-            "Description.\n\n"
-            "**FRs covered:** FR41\n"
-        )
-        mocker.patch(
-            "adws.adw_modules.steps.parse_bmad_story"
-            ".io_ops.read_bmad_file",
-            return_value=IOSuccess(md),
-        )
-        ctx = WorkflowContext(
-            inputs={"bmad_file_path": "epics.md"},
-        )
-        result = parse_bmad_story(ctx)
-        assert isinstance(result, IOSuccess)
-        out = unsafe_perform_io(result.unwrap())
-        epics = out.outputs["parsed_epics"]
-        assert len(epics) == 1
-        assert epics[0].stories == []
@@ -0,0 +1,184 @@
+"""Tests for the mypy, ruff, playwright and jest verify step modules.
+
+The four steps share one shape -- call a single io_ops check and
+store its VerifyResult under ``verify_<tool>`` -- so each behavior is
+parametrized over the tools instead of repeated per file.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple
+
+import pytest
+from returns.io import IOFailure, IOSuccess
+from returns.unsafe import unsafe_perform_io
+
+from adws.adw_modules import steps
+from adws.adw_modules.errors import PipelineError
+from adws.adw_modules.steps.run_jest_step import run_jest_step
+from adws.adw_modules.steps.run_mypy_step import run_mypy_step
+from adws.adw_modules.steps.run_playwright_step import (
+    run_playwright_step,
+)
+from adws.adw_modules.steps.run_ruff_step import run_ruff_step
+from adws.adw_modules.types import VerifyResult, WorkflowContext
+from adws.tests.adw_modules.steps.results import _err, _ok
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from returns.io import IOResult
+
+    from adws.tests.adw_modules.steps.conftest import PatchIo
+
+    VerifyStep = Callable[
+        [WorkflowContext],
+        IOResult[WorkflowContext, PipelineError],
+    ]
+
+_TIMEOUT_ERROR = PipelineError(
+    step_name="io_ops.run_shell_command",
+    error_type="TimeoutError",
+    message="Command timed out",
+)
+_NOT_FOUND_ERROR = PipelineError(
+    step_name="io_ops.run_shell_command",
+    error_type="FileNotFoundError",
+    message="Command not found",
+)
+
+
+class _VerifyCase(NamedTuple):
+    """One verify step and the io_ops results used to drive it."""
+
+    tool_name: str
+    step: VerifyStep
+    io_call: str
+    passing_output: str
+    error_line: str
+    raw_output: str
+    io_error: PipelineError
+
+    @property
+    def step_module(self) -> str:
+        """Step module name, which is also the step's own name."""
+        return f"run_{self.tool_name}_step"
+
+
+_VERIFY_CASES = [
+    _VerifyCase(
+        tool_name="mypy",
+        step=run_mypy_step,
+        io_call="run_mypy_check",
+        passing_output="Success: no issues found",
+        error_line="adws/io_ops.py:10: error: Missing type",
+        raw_output="adws/io_ops.py:10: error: Missing type",
+        io_error=_TIMEOUT_ERROR,
+    ),
+    _VerifyCase(
+        tool_name="ruff",
+        step=run_ruff_step,
+        io_call="run_ruff_check",
+        passing_output="All checks passed!",
+        error_line="adws/io_ops.py:5:1: E302 expected 2 blank",
+        raw_output="adws/io_ops.py:5:1: E302 expected 2 blank",
+        io_error=_NOT_FOUND_ERROR,
+    ),
+    _VerifyCase(
+        tool_name="playwright",
+        step=run_playwright_step,
+        io_call="run_playwright_tests",
+        passing_output="all e2e tests passed",
+        error_line="Error: test failed",
+        raw_output="Error: test failed\n1 test failed",
+        io_error=_NOT_FOUND_ERROR,
+    ),
+    _VerifyCase(
+        tool_name="jest",
+        step=run_jest_step,
+        io_call="run_jest_tests",
+        passing_output="all tests passed",
+        error_line="FAIL src/test.ts",
+        raw_output="FAIL src/test.ts\n1 test failed",
+        io_error=_TIMEOUT_ERROR,
+    ),
+]
+_VERIFY_IDS = [c.tool_name for c in _VERIFY_CASES]
+
+# Mocked io_ops returns, built once per tool at import.
+_PASS_RETURNS: dict[str, IOResult[VerifyResult, PipelineError]] = {
+    c.tool_name: IOSuccess(
+        VerifyResult(
+            tool_name=c.tool_name,
+            passed=True,
+            errors=[],
+            raw_output=c.passing_output,
+        ),
+    )
+    for c in _VERIFY_CASES
+}
+_FAIL_RETURNS: dict[str, IOResult[VerifyResult, PipelineError]] = {
+    c.tool_name: IOSuccess(
+        VerifyResult(
+            tool_name=c.tool_name,
+            passed=False,
+            errors=[c.error_line],
+            raw_output=c.raw_output,
+        ),
+    )
+    for c in _VERIFY_CASES
+}
+
+
+@pytest.mark.parametrize("case", _VERIFY_CASES, ids=_VERIFY_IDS)
+def test_verify_step_importable_from_steps_package(
+    case: _VerifyCase,
+) -> None:
+    """Each verify step is re-exported from the steps package."""
+    assert getattr(steps, case.step_module) is case.step
+
+
+@pytest.mark.parametrize("case", _VERIFY_CASES, ids=_VERIFY_IDS)
+def test_verify_step_success(
+    patch_io: PatchIo,
+    case: _VerifyCase,
+) -> None:
+    """Tool passes: VerifyResult in context outputs."""
+    returned = _PASS_RETURNS[case.tool_name]
+    patch_io(case.step_module, case.io_call, returned)
+    updated_ctx = _ok(case.step(WorkflowContext()))
+    assert updated_ctx.outputs[f"verify_{case.tool_name}"] is (
+        unsafe_perform_io(returned.unwrap())
+    )
+
+
+@pytest.mark.parametrize("case", _VERIFY_CASES, ids=_VERIFY_IDS)
+def test_verify_step_tool_failure(
+    patch_io: PatchIo,
+    case: _VerifyCase,
+) -> None:
+    """Tool fails: IOFailure with PipelineError."""
+    ctx = WorkflowContext()
+    patch_io(
+        case.step_module, case.io_call, _FAIL_RETURNS[case.tool_name],
+    )
+    error = _err(case.step(ctx))
+    assert error.step_name == case.step_module
+    assert error.error_type == "VerifyFailed"
+    assert f"{case.tool_name} check failed" in error.message
+    assert "1 error(s)" in error.message
+    assert error.context["tool_name"] == case.tool_name
+    assert error.context["errors"] == [case.error_line]
+    assert error.context["raw_output"] == case.raw_output
+    # Original context unchanged on failure
+    assert ctx.outputs == {}
+
+
+@pytest.mark.parametrize("case", _VERIFY_CASES, ids=_VERIFY_IDS)
+def test_verify_step_io_failure(
+    patch_io: PatchIo,
+    case: _VerifyCase,
+) -> None:
+    """io_ops IOFailure propagates through bind."""
+    patch_io(case.step_module, case.io_call, IOFailure(case.io_error))
+    error = _err(case.step(WorkflowContext()))
+    assert error is case.io_error
@@ -1,6 +1,8 @@
 """Tests for track_file_operation and track_file_operation_safe steps."""
 from __future__ import annotations
 
+import importlib
+import json
 from typing import TYPE_CHECKING
 
 from returns.io import IOFailure, IOSuccess
@@ -14,27 +16,56 @@ from adws.adw_modules.steps.track_file_operation import (
 from adws.adw_modules.types import WorkflowContext
 
 if TYPE_CHECKING:
+    from unittest.mock import MagicMock
+
     from pytest_mock import MockerFixture
 
+    from adws.tests.adw_modules.steps.conftest import PatchIo
+
+_STEP_MODULE = "track_file_operation"
+_WRITE_BUNDLE = "io_ops.write_context_bundle"
+_WRITE_STDERR = "io_ops.write_stderr"
+_IO_SUCCESS_NONE = IOSuccess(None)
+_DISK_FULL_ERROR = PipelineError(
+    step_name="io_ops.write_context_bundle",
+    error_type="ContextBundleWriteError",
+    message="disk full",
+)
+_STDERR_ERROR = PipelineError(
+    step_name="io_ops.write_stderr",
+    error_type="StderrWriteError",
+    message="broken pipe",
+)
+
+# The steps package re-exports the track_file_operation *function*
+# under the submodule's name, so fetch the module object itself
+# once for attribute patching.
+_tfo_module = importlib.import_module(
+    "adws.adw_modules.steps.track_file_operation",
+)
+
+
+def _parse_jsonl(mock_write: MagicMock) -> dict[str, object]:
+    """Decode the single JSONL entry passed to write_context_bundle."""
+    entry: dict[str, object] = json.loads(
+        mock_write.call_args[0][1].splitlines()[0],
+    )
+    return entry
+
 
 # --- track_file_operation tests ---
 
 
 def test_track_file_operation_success(
-    mocker: MockerFixture,
+    patch_io: PatchIo,
+    base_track_inputs: dict[str, object],
 ) -> None:
     """track_file_operation constructs FileTrackEntry and writes bundle."""
-    mock_write = mocker.patch(
-        "adws.adw_modules.steps.track_file_operation.io_ops"
-        ".write_context_bundle",
-        return_value=IOSuccess(None),
-    )
+    mock_write = patch_io(_STEP_MODULE, _WRITE_BUNDLE, _IO_SUCCESS_NONE)
     ctx = WorkflowContext(
         inputs={
-            "file_path": "/some/file.py",
-            "operation": "read",
+            **base_track_inputs,
             "session_id": "session-abc123",
-            "hook_name": "file_tracker",
         },
     )
     result = track_file_operation(ctx)
@@ -44,21 +75,21 @@ def test_track_file_operation_success(
     mock_write.assert_called_once()
     call_args = mock_write.call_args
     assert call_args[0][0] == "session-abc123"
-    # Verify the JSONL contains expected fields
-    jsonl = call_args[0][1]
-    assert '"/some/file.py"' in jsonl
-    assert '"read"' in jsonl
-    assert '"session-abc123"' in jsonl
-    assert '"file_tracker"' in jsonl
+    entry = _parse_jsonl(mock_write)
+    assert entry["file_path"] == "/some/file.py"
+    assert entry["operation"] == "read"
+    assert entry["session_id"] == "session-abc123"
+    assert entry["hook_name"] == "file_tracker"
 
 
-def test_track_file_operation_missing_file_path() -> None:
+def test_track_file_operation_missing_file_path(
+    base_track_inputs: dict[str, object],
+) -> None:
     """track_file_operation returns IOFailure when file_path missing."""
     ctx = WorkflowContext(
         inputs={
-            "operation": "read",
-            "session_id": "sess-1",
-            "hook_name": "file_tracker",
+            k: v for k, v in base_track_inputs.items()
+            if k != "file_path"
         },
     )
     result = track_file_operation(ctx)
@@ -70,13 +101,14 @@ def test_track_file_operation_missing_file_path() -> None:
     assert "file_path" in error.message
 
 
-def test_track_file_operation_missing_operation() -> None:
+def test_track_file_operation_missing_operation(
+    base_track_inputs: dict[str, object],
+) -> None:
     """track_file_operation returns IOFailure when operation missing."""
     ctx = WorkflowContext(
         inputs={
-            "file_path": "/some/file.py",
-            "session_id": "sess-1",
-            "hook_name": "file_tracker",
+            k: v for k, v in base_track_inputs.items()
+            if k != "operation"
         },
     )
     result = track_file_operation(ctx)
@@ -88,14 +120,14 @@ def test_track_file_operation_missing_operation() -> None:
     assert "operation" in error.message
 
 
-def test_track_file_operation_invalid_operation() -> None:
+def test_track_file_operation_invalid_operation(
+    base_track_inputs: dict[str, object],
+) -> None:
     """track_file_operation returns IOFailure when operation invalid."""
     ctx = WorkflowContext(
         inputs={
-            "file_path": "/some/file.py",
+            **base_track_inputs,
             "operation": "delete",
-            "session_id": "sess-1",
-            "hook_name": "file_tracker",
         },
     )
     result = track_file_operation(ctx)
@@ -109,19 +141,15 @@ def test_track_file_operation_invalid_operation() -> None:
 
 
 def test_track_file_operation_missing_session_id(
-    mocker: MockerFixture,
+    patch_io: PatchIo,
+    base_track_inputs: dict[str, object],
 ) -> None:
     """track_file_operation generates fallback session_id when missing."""
-    mock_write = mocker.patch(
-        "adws.adw_modules.steps.track_file_operation.io_ops"
-        ".write_context_bundle",
-        return_value=IOSuccess(None),
-    )
+    mock_write = patch_io(_STEP_MODULE, _WRITE_BUNDLE, _IO_SUCCESS_NONE)
     ctx = WorkflowContext(
         inputs={
-            "file_path": "/some/file.py",
-            "operation": "read",
-            "hook_name": "file_tracker",
+            k: v for k, v in base_track_inputs.items()
+            if k != "session_id"
         },
     )
     result = track_file_operation(ctx)
@@ -132,49 +160,29 @@ def test_track_file_operation_missing_session_id(
 
 
 def test_track_file_operation_missing_hook_name(
-    mocker: MockerFixture,
+    patch_io: PatchIo,
+    base_track_inputs: dict[str, object],
 ) -> None:
     """track_file_operation defaults to 'file_tracker' when hook_name missing."""
-    mock_write = mocker.patch(
-        "adws.adw_modules.steps.track_file_operation.io_ops"
-        ".write_context_bundle",
-        return_value=IOSuccess(None),
-    )
+    mock_write = patch_io(_STEP_MODULE, _WRITE_BUNDLE, _IO_SUCCESS_NONE)
     ctx = WorkflowContext(
         inputs={
-            "file_path": "/some/file.py",
-            "operation": "write",
-            "session_id": "sess-1",
-        },
+            k: v for k, v in base_track_inputs.items()
+            if k != "hook_name"
+        } | {"operation": "write"},
     )
     result = track_file_operation(ctx)
     assert isinstance(result, IOSuccess)
-    jsonl = mock_write.call_args[0][1]
-    assert '"file_tracker"' in jsonl
+    assert _parse_jsonl(mock_write)["hook_name"] == "file_tracker"
 
 
 def test_track_file_operation_io_failure(
-    mocker: MockerFixture,
+    patch_io: PatchIo,
+    base_track_inputs: dict[str, object],
 ) -> None:
     """track_file_operation returns IOFailure when io_ops fails."""
-    io_error = PipelineError(
-        step_name="io_ops.write_context_bundle",
-        error_type="ContextBundleWriteError",
-        message="disk full",
-    )
-    mocker.patch(
-        "adws.adw_modules.steps.track_file_operation.io_ops"
-        ".write_context_bundle",
-        return_value=IOFailure(io_error),
-    )
-    ctx = WorkflowContext(
-        inputs={
-            "file_path": "/some/file.py",
-            "operation": "read",
-            "session_id": "sess-1",
-            "hook_name": "file_tracker",
-        },
-    )
+    patch_io(_STEP_MODULE, _WRITE_BUNDLE, IOFailure(_DISK_FULL_ERROR))
+    ctx = WorkflowContext(inputs={**base_track_inputs})
     result = track_file_operation(ctx)
     assert isinstance(result, IOFailure)
     error = unsafe_perform_io(result.failure())
@@ -183,49 +191,36 @@ def test_track_file_operation_io_failure(
 
 
 def test_track_file_operation_write_operation(
-    mocker: MockerFixture,
+    patch_io: PatchIo,
+    base_track_inputs: dict[str, object],
 ) -> None:
     """track_file_operation works with write operation."""
-    mock_write = mocker.patch(
-        "adws.adw_modules.steps.track_file_operation.io_ops"
-        ".write_context_bundle",
-        return_value=IOSuccess(None),
-    )
+    mock_write = patch_io(_STEP_MODULE, _WRITE_BUNDLE, _IO_SUCCESS_NONE)
     ctx = WorkflowContext(
         inputs={
+            **base_track_inputs,
             "file_path": "/other/file.py",
             "operation": "write",
             "session_id": "sess-2",
-            "hook_name": "file_tracker",
         },
     )
     result = track_file_operation(ctx)
     assert isinstance(result, IOSuccess)
-    jsonl = mock_write.call_args[0][1]
-    assert '"write"' in jsonl
-    assert '"/other/file.py"' in jsonl
+    entry = _parse_jsonl(mock_write)
+    assert entry["operation"] == "write"
+    assert entry["file_path"] == "/other/file.py"
 
 
 # --- track_file_operation_safe tests ---
 
 
 def test_track_file_operation_safe_success_passthrough(
-    mocker: MockerFixture,
+    patch_io: PatchIo,
+    base_track_inputs: dict[str, object],
 ) -> None:
     """track_file_operation_safe passes through IOSuccess."""
-    mocker.patch(
-        "adws.adw_modules.steps.track_file_operation.io_ops"
-        ".write_context_bundle",
-        return_value=IOSuccess(None),
-    )
-    ctx = WorkflowContext(
-        inputs={
-            "file_path": "/some/file.py",
-            "operation": "read",
-            "session_id": "sess-1",
-            "hook_name": "file_tracker",
-        },
-    )
+    patch_io(_STEP_MODULE, _WRITE_BUNDLE, _IO_SUCCESS_NONE)
+    ctx = WorkflowContext(inputs={**base_track_inputs})
     result = track_file_operation_safe(ctx)
     assert isinstance(result, IOSuccess)
     out_ctx = unsafe_perform_io(result.unwrap())
@@ -233,32 +228,13 @@ def test_track_file_operation_safe_success_passthrough(
 
 
 def test_track_file_operation_safe_catches_failure(
-    mocker: MockerFixture,
+    patch_io: PatchIo,
+    base_track_inputs: dict[str, object],
 ) -> None:
     """track_file_operation_safe catches IOFailure, returns IOSuccess."""
-    io_error = PipelineError(
-        step_name="io_ops.write_context_bundle",
-        error_type="ContextBundleWriteError",
-        message="disk full",
-    )
-    mocker.patch(
-        "adws.adw_modules.steps.track_file_operation.io_ops"
-        ".write_context_bundle",
-        return_value=IOFailure(io_error),
-    )
-    mock_stderr = mocker.patch(
-        "adws.adw_modules.steps.track_file_operation.io_ops"
-        ".write_stderr",
-        return_value=IOSuccess(None),
-    )
-    ctx = WorkflowContext(
-        inputs={
-            "file_path": "/some/file.py",
-            "operation": "read",
-            "session_id": "sess-1",
-            "hook_name": "file_tracker",
-        },
-    )
+    patch_io(_STEP_MODULE, _WRITE_BUNDLE, IOFailure(_DISK_FULL_ERROR))
+    mock_stderr = patch_io(_STEP_MODULE, _WRITE_STDERR, _IO_SUCCESS_NONE)
+    ctx = WorkflowContext(inputs={**base_track_inputs})
     result = track_file_operation_safe(ctx)
     assert isinstance(result, IOSuccess)
     out_ctx = unsafe_perform_io(result.unwrap())
@@ -268,37 +244,13 @@ def test_track_file_operation_safe_catches_failure(
 
 
 def test_track_file_operation_safe_double_failure(
-    mocker: MockerFixture,
+    patch_io: PatchIo,
+    base_track_inputs: dict[str, object],
 ) -> None:
     """track_file_operation_safe returns IOSuccess even on double failure."""
-    io_error = PipelineError(
-        step_name="io_ops.write_context_bundle",
-        error_type="ContextBundleWriteError",
-        message="disk full",
-    )
-    mocker.patch(
-        "adws.adw_modules.steps.track_file_operation.io_ops"
-        ".write_context_bundle",
-        return_value=IOFailure(io_error),
-    )
-    stderr_error = PipelineError(
-        step_name="io_ops.write_stderr",
-        error_type="StderrWriteError",
-        message="broken pipe",
-    )
-    mocker.patch(
-        "adws.adw_modules.steps.track_file_operation.io_ops"
-        ".write_stderr",
-        return_value=IOFailure(stderr_error),
-    )
-    ctx = WorkflowContext(
-        inputs={
-            "file_path": "/some/file.py",
-            "operation": "read",
-            "session_id": "sess-1",
-            "hook_name": "file_tracker",
-        },
-    )
+    patch_io(_STEP_MODULE, _WRITE_BUNDLE, IOFailure(_DISK_FULL_ERROR))
+    patch_io(_STEP_MODULE, _WRITE_STDERR, IOFailure(_STDERR_ERROR))
+    ctx = WorkflowContext(inputs={**base_track_inputs})
     result = track_file_operation_safe(ctx)
     assert isinstance(result, IOSuccess)
     out_ctx = unsafe_perform_io(result.unwrap())
@@ -306,7 +258,9 @@ def test_track_file_operation_safe_double_failure(
 
 
 def test_track_file_operation_safe_catastrophic_failure(
+    patch_io: PatchIo,
     mocker: MockerFixture,
+    base_track_inputs: dict[str, object],
 ) -> None:
     """track_file_operation_safe returns IOSuccess on catastrophic failure.
 
@@ -314,29 +268,13 @@ def test_track_file_operation_safe_catastrophic_failure(
     the try/except catches it and returns IOSuccess with
     a fallback error message (true fail-open defense).
     """
-    io_error = PipelineError(
-        step_name="io_ops.write_context_bundle",
-        error_type="ContextBundleWriteError",
-        message="disk full",
-    )
-    mocker.patch(
-        "adws.adw_modules.steps.track_file_operation.io_ops"
-        ".write_context_bundle",
-        return_value=IOFailure(io_error),
-    )
-    mocker.patch(
-        "adws.adw_modules.steps.track_file_operation"
-        ".unsafe_perform_io",
+    patch_io(_STEP_MODULE, _WRITE_BUNDLE, IOFailure(_DISK_FULL_ERROR))
+    mocker.patch.object(
+        _tfo_module,
+        "unsafe_perform_io",
         side_effect=RuntimeError("catastrophic"),
     )
-    ctx = WorkflowContext(
-        inputs={
-            "file_path": "/some/file.py",
-            "operation": "read",
-            "session_id": "sess-1",
-            "hook_name": "file_tracker",
-        },
-    )
+    ctx = WorkflowContext(inputs={**base_track_inputs})
     result = track_file_operation_safe(ctx)
     assert isinstance(result, IOSuccess)
     out_ctx = unsafe_perform_io(result.unwrap())
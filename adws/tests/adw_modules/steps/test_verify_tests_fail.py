@@ -3,8 +3,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import pytest
 from returns.io import IOFailure, IOSuccess
-from returns.unsafe import unsafe_perform_io
 
 from adws.adw_modules.engine.executor import _STEP_REGISTRY
 from adws.adw_modules.errors import PipelineError
@@ -25,9 +25,12 @@ from adws.adw_modules.types import (
     ShellResult,
     WorkflowContext,
 )
+from adws.tests.adw_modules.steps.results import _err, _ok
 
 if TYPE_CHECKING:
-    from pytest_mock import MockerFixture
+    from returns.io import IOResult
+
+    from adws.tests.adw_modules.steps.conftest import PatchIo
 
 
 # --- Pytest output fixtures ---
@@ -100,65 +103,86 @@ _MIXED_VALID_INVALID_OUTPUT = (
 )
 
 
-# --- Task 1: Constant tests ---
-
-
-class TestValidRedFailures:
-    """Tests for VALID_RED_FAILURES constant."""
-
-    def test_valid_red_failures_is_frozenset(self) -> None:
-        """VALID_RED_FAILURES is a frozenset of strings."""
-        assert isinstance(VALID_RED_FAILURES, frozenset)
-
-    def test_valid_red_failures_contains_import_error(
-        self,
-    ) -> None:
-        """VALID_RED_FAILURES contains ImportError."""
-        assert "ImportError" in VALID_RED_FAILURES
-
-    def test_valid_red_failures_contains_assertion_error(
-        self,
-    ) -> None:
-        """VALID_RED_FAILURES contains AssertionError."""
-        assert "AssertionError" in VALID_RED_FAILURES
-
-    def test_valid_red_failures_contains_not_implemented(
-        self,
-    ) -> None:
-        """VALID_RED_FAILURES contains NotImplementedError."""
-        assert "NotImplementedError" in VALID_RED_FAILURES
+# --- Mocked run_shell_command returns, one per scenario ---
 
-    def test_valid_red_failures_contains_attribute_error(
-        self,
-    ) -> None:
-        """VALID_RED_FAILURES contains AttributeError."""
-        assert "AttributeError" in VALID_RED_FAILURES
+_IMPORT_ERROR_IO = IOSuccess(
+    ShellResult(
+        return_code=1,
+        stdout=_IMPORT_ERROR_OUTPUT,
+        stderr="",
+        command=RED_GATE_PYTEST_COMMAND,
+    ),
+)
+_ASSERTION_ERROR_IO = IOSuccess(
+    ShellResult(
+        return_code=1,
+        stdout=_ASSERTION_ERROR_OUTPUT,
+        stderr="",
+        command=RED_GATE_PYTEST_COMMAND,
+    ),
+)
+_SYNTAX_ERROR_IO = IOSuccess(
+    ShellResult(
+        return_code=1,
+        stdout=_SYNTAX_ERROR_OUTPUT,
+        stderr="",
+        command=RED_GATE_PYTEST_COMMAND,
+    ),
+)
+_ALL_PASSED_IO = IOSuccess(
+    ShellResult(
+        return_code=0,
+        stdout=_ALL_PASSED_OUTPUT,
+        stderr="",
+        command=RED_GATE_PYTEST_COMMAND,
+    ),
+)
+_NO_TESTS_RAN_IO = IOSuccess(
+    ShellResult(
+        return_code=5,
+        stdout=_NO_TESTS_RAN_OUTPUT,
+        stderr="",
+        command=RED_GATE_PYTEST_COMMAND,
+    ),
+)
+_MIXED_VALID_INVALID_IO = IOSuccess(
+    ShellResult(
+        return_code=1,
+        stdout=_MIXED_VALID_INVALID_OUTPUT,
+        stderr="",
+        command=RED_GATE_PYTEST_COMMAND,
+    ),
+)
+_SHELL_FAILURE_IO = IOFailure(
+    PipelineError(
+        step_name="io_ops.run_shell_command",
+        error_type="ShellExecutionError",
+        message="pytest not found",
+    ),
+)
 
 
-class TestInvalidRedFailures:
-    """Tests for INVALID_RED_FAILURES constant."""
+# --- Task 1: Constant tests ---
 
-    def test_invalid_red_failures_is_frozenset(self) -> None:
-        """INVALID_RED_FAILURES is a frozenset of strings."""
-        assert isinstance(INVALID_RED_FAILURES, frozenset)
 
-    def test_invalid_red_failures_contains_syntax_error(
-        self,
-    ) -> None:
-        """INVALID_RED_FAILURES contains SyntaxError."""
-        assert "SyntaxError" in INVALID_RED_FAILURES
+# Rows: (name, constant it must belong to)
+_RED_FAILURE_MEMBERS: list[tuple[str, frozenset[str]]] = [
+    ("ImportError", VALID_RED_FAILURES),
+    ("AssertionError", VALID_RED_FAILURES),
+    ("NotImplementedError", VALID_RED_FAILURES),
+    ("AttributeError", VALID_RED_FAILURES),
+    ("SyntaxError", INVALID_RED_FAILURES),
+    ("IndentationError", INVALID_RED_FAILURES),
+    ("NameError", INVALID_RED_FAILURES),
+]
 
-    def test_invalid_red_failures_contains_indentation_error(
-        self,
-    ) -> None:
-        """INVALID_RED_FAILURES contains IndentationError."""
-        assert "IndentationError" in INVALID_RED_FAILURES
 
-    def test_invalid_red_failures_contains_name_error(
-        self,
-    ) -> None:
-        """INVALID_RED_FAILURES contains NameError."""
-        assert "NameError" in INVALID_RED_FAILURES
+def test_red_failure_constants() -> None:
+    """Both constants are frozensets holding their failure types."""
+    assert isinstance(VALID_RED_FAILURES, frozenset)
+    assert isinstance(INVALID_RED_FAILURES, frozenset)
+    for name, container in _RED_FAILURE_MEMBERS:
+        assert name in container, name
 
 
 # --- Task 2: _parse_pytest_output tests ---
@@ -398,185 +422,99 @@ class TestClassifyFailures:
 # --- Task 4: verify_tests_fail step tests ---
 
 
+# Rows: (id, shell return, failure type reported on success)
+_SUCCESS_CASES: list[
+    tuple[str, IOResult[ShellResult, PipelineError], str]
+] = [
+    ("valid-red-import", _IMPORT_ERROR_IO, "ImportError"),
+    ("valid-red-assertion", _ASSERTION_ERROR_IO, "AssertionError"),
+]
+
+# Rows: (id, shell return, error_type, substring of the message)
+_FAILURE_CASES: list[
+    tuple[str, IOResult[ShellResult, PipelineError], str, str]
+] = [
+    (
+        "tests-passed",
+        _ALL_PASSED_IO,
+        "TestsPassedInRedPhase",
+        "passed unexpectedly",
+    ),
+    (
+        "invalid-syntax",
+        _SYNTAX_ERROR_IO,
+        "InvalidRedFailure",
+        "SyntaxError",
+    ),
+    (
+        "mixed-types",
+        _MIXED_VALID_INVALID_IO,
+        "InvalidRedFailure",
+        "SyntaxError",
+    ),
+    (
+        "no-tests-ran",
+        _NO_TESTS_RAN_IO,
+        "NoTestsRan",
+        "No tests were discovered",
+    ),
+    (
+        "shell-failure",
+        _SHELL_FAILURE_IO,
+        "ShellExecutionError",
+        "pytest not found",
+    ),
+]
+
+
 class TestVerifyTestsFail:
     """Tests for verify_tests_fail step function."""
 
+    @pytest.mark.parametrize(
+        ("shell_return", "failure_type"),
+        [c[1:] for c in _SUCCESS_CASES],
+        ids=[c[0] for c in _SUCCESS_CASES],
+    )
     def test_verify_tests_fail_valid_red(
         self,
-        mocker: MockerFixture,
-    ) -> None:
-        """Valid RED: ImportError -> IOSuccess."""
-        mocker.patch(
-            "adws.adw_modules.steps.verify_tests_fail"
-            ".io_ops.run_shell_command",
-            return_value=IOSuccess(
-                ShellResult(
-                    return_code=1,
-                    stdout=_IMPORT_ERROR_OUTPUT,
-                    stderr="",
-                    command="pytest",
-                ),
-            ),
-        )
-        ctx = WorkflowContext(inputs={})
-        result = verify_tests_fail(ctx)
-
-        assert isinstance(result, IOSuccess)
-        updated = unsafe_perform_io(result.unwrap())
-        assert updated.outputs["red_gate_passed"] is True
-        assert "ImportError" in updated.outputs[
-            "failure_types"
-        ]
-
-    def test_verify_tests_fail_tests_passed(
-        self,
-        mocker: MockerFixture,
-    ) -> None:
-        """Tests pass -> IOFailure(TestsPassedInRedPhase)."""
-        mocker.patch(
-            "adws.adw_modules.steps.verify_tests_fail"
-            ".io_ops.run_shell_command",
-            return_value=IOSuccess(
-                ShellResult(
-                    return_code=0,
-                    stdout=_ALL_PASSED_OUTPUT,
-                    stderr="",
-                    command="pytest",
-                ),
-            ),
-        )
-        ctx = WorkflowContext(inputs={})
-        result = verify_tests_fail(ctx)
-
-        assert isinstance(result, IOFailure)
-        err = unsafe_perform_io(result.failure())
-        assert err.step_name == "verify_tests_fail"
-        assert err.error_type == "TestsPassedInRedPhase"
-
-    def test_verify_tests_fail_invalid_failure(
-        self,
-        mocker: MockerFixture,
+        patch_io: PatchIo,
+        story_ctx: WorkflowContext,
+        shell_return: IOResult[ShellResult, PipelineError],
+        failure_type: str,
     ) -> None:
-        """SyntaxError -> IOFailure(InvalidRedFailure)."""
-        mocker.patch(
-            "adws.adw_modules.steps.verify_tests_fail"
-            ".io_ops.run_shell_command",
-            return_value=IOSuccess(
-                ShellResult(
-                    return_code=1,
-                    stdout=_SYNTAX_ERROR_OUTPUT,
-                    stderr="",
-                    command="pytest",
-                ),
-            ),
+        """Valid RED failures pass the gate."""
+        patch_io(
+            "verify_tests_fail", "io_ops.run_shell_command", shell_return,
         )
-        ctx = WorkflowContext(inputs={})
-        result = verify_tests_fail(ctx)
 
-        assert isinstance(result, IOFailure)
-        err = unsafe_perform_io(result.failure())
-        assert err.step_name == "verify_tests_fail"
-        assert err.error_type == "InvalidRedFailure"
-        assert "SyntaxError" in err.message
+        updated = _ok(verify_tests_fail(story_ctx))
 
-    def test_verify_tests_fail_shell_failure(
-        self,
-        mocker: MockerFixture,
-    ) -> None:
-        """Shell failure -> IOFailure propagated."""
-        mocker.patch(
-            "adws.adw_modules.steps.verify_tests_fail"
-            ".io_ops.run_shell_command",
-            return_value=IOFailure(
-                PipelineError(
-                    step_name="io_ops.run_shell_command",
-                    error_type="ShellExecutionError",
-                    message="pytest not found",
-                ),
-            ),
-        )
-        ctx = WorkflowContext(inputs={})
-        result = verify_tests_fail(ctx)
-
-        assert isinstance(result, IOFailure)
-        err = unsafe_perform_io(result.failure())
-        assert err.step_name == "verify_tests_fail"
+        assert updated.outputs["red_gate_passed"] is True
+        assert failure_type in updated.outputs["failure_types"]
 
-    def test_verify_tests_fail_mixed_types(
+    @pytest.mark.parametrize(
+        ("shell_return", "error_type", "needle"),
+        [c[1:] for c in _FAILURE_CASES],
+        ids=[c[0] for c in _FAILURE_CASES],
+    )
+    def test_verify_tests_fail_rejects(
         self,
-        mocker: MockerFixture,
+        patch_io: PatchIo,
+        story_ctx: WorkflowContext,
+        shell_return: IOResult[ShellResult, PipelineError],
+        error_type: str,
+        needle: str,
     ) -> None:
-        """Mixed valid+invalid -> IOFailure."""
-        mocker.patch(
-            "adws.adw_modules.steps.verify_tests_fail"
-            ".io_ops.run_shell_command",
-            return_value=IOSuccess(
-                ShellResult(
-                    return_code=1,
-                    stdout=_MIXED_VALID_INVALID_OUTPUT,
-                    stderr="",
-                    command="pytest",
-                ),
-            ),
+        """Other outcomes fail with a typed verify_tests_fail error."""
+        patch_io(
+            "verify_tests_fail", "io_ops.run_shell_command", shell_return,
         )
-        ctx = WorkflowContext(inputs={})
-        result = verify_tests_fail(ctx)
-
-        assert isinstance(result, IOFailure)
-        err = unsafe_perform_io(result.failure())
-        assert err.error_type == "InvalidRedFailure"
 
-    def test_verify_tests_fail_no_tests_ran(
-        self,
-        mocker: MockerFixture,
-    ) -> None:
-        """No tests ran -> IOFailure(NoTestsRan)."""
-        mocker.patch(
-            "adws.adw_modules.steps.verify_tests_fail"
-            ".io_ops.run_shell_command",
-            return_value=IOSuccess(
-                ShellResult(
-                    return_code=5,
-                    stdout=_NO_TESTS_RAN_OUTPUT,
-                    stderr="",
-                    command="pytest",
-                ),
-            ),
-        )
-        ctx = WorkflowContext(inputs={})
-        result = verify_tests_fail(ctx)
+        err = _err(verify_tests_fail(story_ctx))
 
-        assert isinstance(result, IOFailure)
-        err = unsafe_perform_io(result.failure())
         assert err.step_name == "verify_tests_fail"
-        assert err.error_type == "NoTestsRan"
-
-    def test_verify_tests_fail_assertion_error(
-        self,
-        mocker: MockerFixture,
-    ) -> None:
-        """AssertionError -> IOSuccess."""
-        mocker.patch(
-            "adws.adw_modules.steps.verify_tests_fail"
-            ".io_ops.run_shell_command",
-            return_value=IOSuccess(
-                ShellResult(
-                    return_code=1,
-                    stdout=_ASSERTION_ERROR_OUTPUT,
-                    stderr="",
-                    command="pytest",
-                ),
-            ),
-        )
-        ctx = WorkflowContext(inputs={})
-        result = verify_tests_fail(ctx)
-
-        assert isinstance(result, IOSuccess)
-        updated = unsafe_perform_io(result.unwrap())
-        assert updated.outputs["red_gate_passed"] is True
-        assert "AssertionError" in updated.outputs[
-            "failure_types"
-        ]
+        assert err.error_type == error_type
+        assert needle in err.message
 
 
 # --- Task 5: RED_GATE_PYTEST_COMMAND tests ---
@@ -596,25 +534,18 @@ class TestRedGatePytestCommand:
 
     def test_verify_tests_fail_command_used(
         self,
-        mocker: MockerFixture,
+        patch_io: PatchIo,
+        story_ctx: WorkflowContext,
     ) -> None:
         """verify_tests_fail calls run_shell_command."""
-        mock_shell = mocker.patch(
-            "adws.adw_modules.steps.verify_tests_fail"
-            ".io_ops.run_shell_command",
-            return_value=IOSuccess(
-                ShellResult(
-                    return_code=1,
-                    stdout=_IMPORT_ERROR_OUTPUT,
-                    stderr="",
-                    command=RED_GATE_PYTEST_COMMAND,
-                ),
-            ),
+        shell_mock = patch_io(
+            "verify_tests_fail",
+            "io_ops.run_shell_command",
+            _IMPORT_ERROR_IO,
         )
-        ctx = WorkflowContext(inputs={})
-        verify_tests_fail(ctx)
+        verify_tests_fail(story_ctx)
 
-        mock_shell.assert_called_once_with(
+        shell_mock.assert_called_once_with(
             RED_GATE_PYTEST_COMMAND,
         )
 
@@ -648,20 +579,13 @@ class TestVerifyTestsFailIntegration:
 
     def test_integration_valid_red(
         self,
-        mocker: MockerFixture,
+        patch_io: PatchIo,
     ) -> None:
         """Full flow: ImportError -> IOSuccess."""
-        mock_shell = mocker.patch(
-            "adws.adw_modules.steps.verify_tests_fail"
-            ".io_ops.run_shell_command",
-            return_value=IOSuccess(
-                ShellResult(
-                    return_code=1,
-                    stdout=_IMPORT_ERROR_OUTPUT,
-                    stderr="",
-                    command=RED_GATE_PYTEST_COMMAND,
-                ),
-            ),
+        shell_mock = patch_io(
+            "verify_tests_fail",
+            "io_ops.run_shell_command",
+            _IMPORT_ERROR_IO,
         )
         ctx = WorkflowContext(
             inputs={
@@ -674,108 +598,11 @@ class TestVerifyTestsFailIntegration:
         )
         result = verify_tests_fail(ctx)
 
-        assert isinstance(result, IOSuccess)
-        updated = unsafe_perform_io(result.unwrap())
+        updated = _ok(result)
         assert updated.outputs["red_gate_passed"] is True
         assert "ImportError" in updated.outputs[
             "failure_types"
         ]
-        mock_shell.assert_called_once_with(
+        shell_mock.assert_called_once_with(
             RED_GATE_PYTEST_COMMAND,
         )
-
-    def test_integration_tests_passed(
-        self,
-        mocker: MockerFixture,
-    ) -> None:
-        """Full flow: all passed -> IOFailure."""
-        mocker.patch(
-            "adws.adw_modules.steps.verify_tests_fail"
-            ".io_ops.run_shell_command",
-            return_value=IOSuccess(
-                ShellResult(
-                    return_code=0,
-                    stdout=_ALL_PASSED_OUTPUT,
-                    stderr="",
-                    command=RED_GATE_PYTEST_COMMAND,
-                ),
-            ),
-        )
-        ctx = WorkflowContext(inputs={})
-        result = verify_tests_fail(ctx)
-
-        assert isinstance(result, IOFailure)
-        err = unsafe_perform_io(result.failure())
-        assert err.error_type == "TestsPassedInRedPhase"
-
-    def test_integration_syntax_error(
-        self,
-        mocker: MockerFixture,
-    ) -> None:
-        """Full flow: SyntaxError -> IOFailure."""
-        mocker.patch(
-            "adws.adw_modules.steps.verify_tests_fail"
-            ".io_ops.run_shell_command",
-            return_value=IOSuccess(
-                ShellResult(
-                    return_code=1,
-                    stdout=_SYNTAX_ERROR_OUTPUT,
-                    stderr="",
-                    command=RED_GATE_PYTEST_COMMAND,
-                ),
-            ),
-        )
-        ctx = WorkflowContext(inputs={})
-        result = verify_tests_fail(ctx)
-
-        assert isinstance(result, IOFailure)
-        err = unsafe_perform_io(result.failure())
-        assert err.error_type == "InvalidRedFailure"
-        assert "SyntaxError" in err.message
-
-    def test_integration_shell_failure(
-        self,
-        mocker: MockerFixture,
-    ) -> None:
-        """Full flow: shell failure -> IOFailure."""
-        mocker.patch(
-            "adws.adw_modules.steps.verify_tests_fail"
-            ".io_ops.run_shell_command",
-            return_value=IOFailure(
-                PipelineError(
-                    step_name="io_ops.run_shell_command",
-                    error_type="ShellExecutionError",
-                    message="Command not found",
-                ),
-            ),
-        )
-        ctx = WorkflowContext(inputs={})
-        result = verify_tests_fail(ctx)
-
-        assert isinstance(result, IOFailure)
-        err = unsafe_perform_io(result.failure())
-        assert err.step_name == "verify_tests_fail"
-
-    def test_integration_no_tests_ran(
-        self,
-        mocker: MockerFixture,
-    ) -> None:
-        """Full flow: no tests ran -> IOFailure."""
-        mocker.patch(
-            "adws.adw_modules.steps.verify_tests_fail"
-            ".io_ops.run_shell_command",
-            return_value=IOSuccess(
-                ShellResult(
-                    return_code=5,
-                    stdout=_NO_TESTS_RAN_OUTPUT,
-                    stderr="",
-                    command=RED_GATE_PYTEST_COMMAND,
-                ),
-            ),
-        )
-        ctx = WorkflowContext(inputs={})
-        result = verify_tests_fail(ctx)
-
-        assert isinstance(result, IOFailure)
-        err = unsafe_perform_io(result.failure())
-        assert err.error_type == "NoTestsRan"
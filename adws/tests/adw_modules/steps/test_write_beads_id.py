@@ -6,8 +6,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import pytest
 from returns.io import IOFailure, IOSuccess
-from returns.unsafe import unsafe_perform_io
 
 from adws.adw_modules.errors import PipelineError
 from adws.adw_modules.steps.write_beads_id import (
@@ -16,11 +16,36 @@ from adws.adw_modules.steps.write_beads_id import (
     write_beads_id,
 )
 from adws.adw_modules.types import BmadStory, WorkflowContext
+from adws.tests.adw_modules.steps.results import _err, _ok
 
 if TYPE_CHECKING:
     from pytest_mock import MockerFixture
 
 
+_READ_TARGET = (
+    "adws.adw_modules.steps.write_beads_id.io_ops.read_bmad_file"
+)
+_WRITE_TARGET = (
+    "adws.adw_modules.steps.write_beads_id.io_ops.write_bmad_file"
+)
+
+
+@pytest.fixture(scope="module")
+def default_story() -> BmadStory:
+    """Minimal story for tests that only need a valid BmadStory.
+
+    BmadStory is frozen, so one instance serves the module.
+    """
+    return BmadStory(
+        epic_number=1,
+        story_number=1,
+        title="T",
+        slug="s",
+        user_story="u",
+        acceptance_criteria="a",
+    )
+
+
 # --- _inject_beads_id tests ---
 
 
@@ -153,13 +178,11 @@ class TestWriteBeadsId:
         )
         file_content = "---\nstatus: dev\n---\n\n#### Story 6.1"
         mocker.patch(
-            "adws.adw_modules.steps.write_beads_id"
-            ".io_ops.read_bmad_file",
+            _READ_TARGET,
             return_value=IOSuccess(file_content),
         )
         mock_write = mocker.patch(
-            "adws.adw_modules.steps.write_beads_id"
-            ".io_ops.write_bmad_file",
+            _WRITE_TARGET,
             return_value=IOSuccess(None),
         )
         ctx = WorkflowContext(
@@ -170,29 +193,25 @@ class TestWriteBeadsId:
             },
         )
         result = write_beads_id(ctx)
-        assert isinstance(result, IOSuccess)
-        out = unsafe_perform_io(result.unwrap())
+        out = _ok(result)
         assert out.outputs["beads_id_written"] is True
         assert out.outputs["story_slug"] == "6-1-bmad-markdown-parser"
         mock_write.assert_called_once()
         written = mock_write.call_args[0][1]
         assert "beads_id: ISSUE-42" in written
 
-    def test_missing_beads_issue_id(self) -> None:
+    def test_missing_beads_issue_id(
+        self, default_story: BmadStory,
+    ) -> None:
         """Returns IOFailure when beads_issue_id missing."""
         ctx = WorkflowContext(
             inputs={
-                "current_story": BmadStory(
-                    epic_number=1, story_number=1,
-                    title="T", slug="s",
-                    user_story="u", acceptance_criteria="a",
-                ),
+                "current_story": default_story,
                 "bmad_file_path": "epics.md",
             },
         )
         result = write_beads_id(ctx)
-        assert isinstance(result, IOFailure)
-        error = unsafe_perform_io(result.failure())
+        error = _err(result)
         assert error.error_type == "MissingInputError"
         assert error.step_name == "write_beads_id"
 
@@ -205,8 +224,7 @@ class TestWriteBeadsId:
             },
         )
         result = write_beads_id(ctx)
-        assert isinstance(result, IOFailure)
-        error = unsafe_perform_io(result.failure())
+        error = _err(result)
         assert error.error_type == "MissingInputError"
         assert error.step_name == "write_beads_id"
 
@@ -220,35 +238,32 @@ class TestWriteBeadsId:
             },
         )
         result = write_beads_id(ctx)
-        assert isinstance(result, IOFailure)
-        error = unsafe_perform_io(result.failure())
+        error = _err(result)
         assert error.error_type == "MissingInputError"
 
-    def test_missing_bmad_file_path(self) -> None:
+    def test_missing_bmad_file_path(
+        self, default_story: BmadStory,
+    ) -> None:
         """Returns IOFailure when bmad_file_path missing."""
         ctx = WorkflowContext(
             inputs={
                 "beads_issue_id": "ISSUE-42",
-                "current_story": BmadStory(
-                    epic_number=1, story_number=1,
-                    title="T", slug="s",
-                    user_story="u", acceptance_criteria="a",
-                ),
+                "current_story": default_story,
             },
         )
         result = write_beads_id(ctx)
-        assert isinstance(result, IOFailure)
-        error = unsafe_perform_io(result.failure())
+        error = _err(result)
         assert error.error_type == "MissingInputError"
         assert error.step_name == "write_beads_id"
 
     def test_read_failure_propagates(
-        self, mocker: MockerFixture,
+        self,
+        mocker: MockerFixture,
+        default_story: BmadStory,
     ) -> None:
         """IOFailure from read_bmad_file propagates."""
-        mocker.patch(
-            "adws.adw_modules.steps.write_beads_id"
-            ".io_ops.read_bmad_file",
+        mock_read = mocker.patch(
+            _READ_TARGET,
             return_value=IOFailure(
                 PipelineError(
                     step_name="io_ops.read_bmad_file",
@@ -257,34 +272,32 @@ class TestWriteBeadsId:
                 ),
             ),
         )
+        mock_write = mocker.patch(_WRITE_TARGET)
         ctx = WorkflowContext(
             inputs={
                 "beads_issue_id": "ISSUE-42",
-                "current_story": BmadStory(
-                    epic_number=1, story_number=1,
-                    title="T", slug="s",
-                    user_story="u", acceptance_criteria="a",
-                ),
+                "current_story": default_story,
                 "bmad_file_path": "epics.md",
             },
         )
         result = write_beads_id(ctx)
-        assert isinstance(result, IOFailure)
-        error = unsafe_perform_io(result.failure())
+        error = _err(result)
         assert error.error_type == "FileNotFoundError"
+        mock_read.assert_called_once_with("epics.md")
+        mock_write.assert_not_called()
 
     def test_write_failure_propagates(
-        self, mocker: MockerFixture,
+        self,
+        mocker: MockerFixture,
+        default_story: BmadStory,
     ) -> None:
         """IOFailure from write_bmad_file propagates."""
         mocker.patch(
-            "adws.adw_modules.steps.write_beads_id"
-            ".io_ops.read_bmad_file",
+            _READ_TARGET,
             return_value=IOSuccess("---\nstatus: dev\n---\n\ncontent"),
         )
-        mocker.patch(
-            "adws.adw_modules.steps.write_beads_id"
-            ".io_ops.write_bmad_file",
+        mock_write = mocker.patch(
+            _WRITE_TARGET,
             return_value=IOFailure(
                 PipelineError(
                     step_name="io_ops.write_bmad_file",
@@ -296,47 +309,39 @@ class TestWriteBeadsId:
         ctx = WorkflowContext(
             inputs={
                 "beads_issue_id": "ISSUE-42",
-                "current_story": BmadStory(
-                    epic_number=1, story_number=1,
-                    title="T", slug="s",
-                    user_story="u", acceptance_criteria="a",
-                ),
+                "current_story": default_story,
                 "bmad_file_path": "epics.md",
             },
         )
         result = write_beads_id(ctx)
-        assert isinstance(result, IOFailure)
-        error = unsafe_perform_io(result.failure())
+        error = _err(result)
         assert error.error_type == "PermissionError"
+        mock_write.assert_called_once()
+        assert mock_write.call_args[0][0] == "epics.md"
 
     def test_idempotent_skip(
-        self, mocker: MockerFixture,
+        self,
+        mocker: MockerFixture,
+        default_story: BmadStory,
     ) -> None:
         """Skips write when file already has beads_id."""
         file_content = "---\nbeads_id: ISSUE-42\n---\n\ncontent"
         mocker.patch(
-            "adws.adw_modules.steps.write_beads_id"
-            ".io_ops.read_bmad_file",
+            _READ_TARGET,
             return_value=IOSuccess(file_content),
         )
         mock_write = mocker.patch(
-            "adws.adw_modules.steps.write_beads_id"
-            ".io_ops.write_bmad_file",
+            _WRITE_TARGET,
         )
         ctx = WorkflowContext(
             inputs={
                 "beads_issue_id": "ISSUE-42",
-                "current_story": BmadStory(
-                    epic_number=1, story_number=1,
-                    title="T", slug="s",
-                    user_story="u", acceptance_criteria="a",
-                ),
+                "current_story": default_story,
                 "bmad_file_path": "epics.md",
             },
         )
         result = write_beads_id(ctx)
-        assert isinstance(result, IOSuccess)
-        out = unsafe_perform_io(result.unwrap())
+        out = _ok(result)
         assert out.outputs["beads_id_written"] is False
         assert out.outputs["skipped_reason"] == "already_has_beads_id"
         mock_write.assert_not_called()
@@ -355,13 +360,11 @@ class TestWriteBeadsId:
             raw_content="#### Story 6.3",
         )
         mocker.patch(
-            "adws.adw_modules.steps.write_beads_id"
-            ".io_ops.read_bmad_file",
+            _READ_TARGET,
             return_value=IOSuccess("---\nstatus: dev\n---\n\ncontent"),
         )
         mocker.patch(
-            "adws.adw_modules.steps.write_beads_id"
-            ".io_ops.write_bmad_file",
+            _WRITE_TARGET,
             return_value=IOSuccess(None),
         )
         ctx = WorkflowContext(
@@ -372,7 +375,6 @@ class TestWriteBeadsId:
             },
         )
         result = write_beads_id(ctx)
-        assert isinstance(result, IOSuccess)
-        out = unsafe_perform_io(result.unwrap())
+        out = _ok(result)
         assert out.outputs["story_slug"] == "6-3-bidirectional-tracking-convert"
         assert out.outputs["beads_id_written"] is True
@@ -2,10 +2,13 @@
 from __future__ import annotations
 
 import builtins
+import os
 import subprocess
+import sys
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
+import pytest
 from claude_agent_sdk import (
     ClaudeSDKError,
     CLIConnectionError,
@@ -17,6 +20,7 @@ from claude_agent_sdk import (
 from returns.io import IOFailure, IOSuccess
 from returns.unsafe import unsafe_perform_io
 
+from adws.adw_modules import io_ops
 from adws.adw_modules.engine.types import Workflow
 from adws.adw_modules.errors import PipelineError
 from adws.adw_modules.io_ops import (
@@ -56,8 +60,19 @@ from adws.adw_modules.types import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from pathlib import Path
 
+    PatchQuery = Callable[[Callable[..., Any]], None]
+
+# chmod(0o000) only makes a file unreadable where permission bits
+# are enforced: root bypasses them and Windows ignores them.
+_requires_chmod = pytest.mark.skipif(
+    sys.platform == "win32"
+    or (hasattr(os, "geteuid") and os.geteuid() == 0),
+    reason="permission bits unenforced",
+)
+
 
 def test_read_file_success(tmp_path: Path) -> None:
     """Test read_file returns IOSuccess with file contents."""
@@ -78,17 +93,20 @@ def test_read_file_not_found(tmp_path: Path) -> None:
     assert "nonexistent.txt" in error.message
 
 
+@_requires_chmod
 def test_read_file_permission_error(tmp_path: Path) -> None:
     """Test read_file returns IOFailure on permission error."""
     test_file = tmp_path / "noperm.txt"
     test_file.write_text("secret")
     test_file.chmod(0o000)
-    result = read_file(test_file)
-    assert isinstance(result, IOFailure)
-    error = unsafe_perform_io(result.failure())
-    assert isinstance(error, PipelineError)
-    assert error.error_type == "PermissionError"
-    test_file.chmod(0o644)
+    try:
+        result = read_file(test_file)
+        assert isinstance(result, IOFailure)
+        error = unsafe_perform_io(result.failure())
+        assert isinstance(error, PipelineError)
+        assert error.error_type == "PermissionError"
+    finally:
+        test_file.chmod(0o644)
 
 
 def test_read_file_is_a_directory(tmp_path: Path) -> None:
@@ -107,7 +125,9 @@ def test_check_sdk_import_success() -> None:
     assert unsafe_perform_io(result.unwrap()) is True
 
 
-def test_check_sdk_import_failure(mocker) -> None:  # type: ignore[no-untyped-def]
+def test_check_sdk_import_failure(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     """Test check_sdk_import returns IOFailure when SDK import fails."""
     real_import = builtins.__import__
 
@@ -117,9 +137,12 @@ def test_check_sdk_import_failure(mocker) -> None:  # type: ignore[no-untyped-de
             raise ImportError(msg)
         return real_import(name, *args, **kwargs)  # pragma: no cover
 
-    mocker.patch("builtins.__import__", side_effect=fail_sdk_import)
+    # Every import goes through the hook while it is installed, so
+    # restore the real one as soon as check_sdk_import returns.
+    with monkeypatch.context() as patch_ctx:
+        patch_ctx.setattr(builtins, "__import__", fail_sdk_import)
+        result = check_sdk_import()
 
-    result = check_sdk_import()
     assert isinstance(result, IOFailure)
     error = unsafe_perform_io(result.failure())
     assert isinstance(error, PipelineError)
@@ -129,19 +152,23 @@ def test_check_sdk_import_failure(mocker) -> None:  # type: ignore[no-untyped-de
 # --- execute_sdk_call tests ---
 
 
-def _make_result_message(**overrides: Any) -> ResultMessage:
-    """Create a real ResultMessage with test defaults."""
+@pytest.fixture(scope="module")
+def default_result_message() -> ResultMessage:
+    """Real ResultMessage with test defaults, built once per module.
+
+    execute_sdk_call only reads the message, so tests share it.
+    """
     return ResultMessage(
-        subtype=overrides.get("subtype", "result"),
-        duration_ms=overrides.get("duration_ms", 1500),
-        duration_api_ms=overrides.get("duration_api_ms", 1200),
-        is_error=overrides.get("is_error", False),
-        num_turns=overrides.get("num_turns", 2),
-        session_id=overrides.get("session_id", "sess-abc"),
-        total_cost_usd=overrides.get("total_cost_usd", 0.003),
-        result=overrides.get("result", "Hello from Claude"),
-        usage=overrides.get("usage"),
-        structured_output=overrides.get("structured_output"),
+        subtype="result",
+        duration_ms=1500,
+        duration_api_ms=1200,
+        is_error=False,
+        num_turns=2,
+        session_id="sess-abc",
+        total_cost_usd=0.003,
+        result="Hello from Claude",
+        usage=None,
+        structured_output=None,
     )
 
 
@@ -154,17 +181,35 @@ class FakeOtherMessage:
     content: str = "thinking..."
 
 
-def test_execute_sdk_call_success(mocker) -> None:  # type: ignore[no-untyped-def]
+@pytest.fixture
+def patched_query(
+    monkeypatch: pytest.MonkeyPatch,
+) -> PatchQuery:
+    """Return a helper that swaps io_ops.query for a fake generator.
+
+    The fake is installed as-is: no test inspects query's calls,
+    so there is no MagicMock to record them.
+    """
+
+    def _apply(fake_query: Callable[..., Any]) -> None:
+        monkeypatch.setattr(io_ops, "query", fake_query)
+
+    return _apply
+
+
+def test_execute_sdk_call_success(
+    patched_query: PatchQuery,
+    default_result_message: ResultMessage,
+) -> None:
     """Test execute_sdk_call returns IOSuccess with AdwsResponse."""
-    fake_result = _make_result_message()
 
     async def fake_query(
         *, prompt: str, options: object = None
     ) -> Any:
         yield FakeOtherMessage()
-        yield fake_result
+        yield default_result_message
 
-    mocker.patch("adws.adw_modules.io_ops.query", side_effect=fake_query)
+    patched_query(fake_query)
 
     request = AdwsRequest(system_prompt="sys", prompt="hello")
     result = execute_sdk_call(request)
@@ -180,7 +225,10 @@ def test_execute_sdk_call_success(mocker) -> None:  # type: ignore[no-untyped-de
     assert response.num_turns == 2
 
 
-def test_execute_sdk_call_passes_options(mocker) -> None:  # type: ignore[no-untyped-def]
+def test_execute_sdk_call_passes_options(
+    patched_query: PatchQuery,
+    default_result_message: ResultMessage,
+) -> None:
     """Test execute_sdk_call translates AdwsRequest fields to SDK options."""
     captured_opts: list[Any] = []
 
@@ -188,9 +236,9 @@ def test_execute_sdk_call_passes_options(mocker) -> None:  # type: ignore[no-unt
         *, prompt: str, options: object = None
     ) -> Any:
         captured_opts.append(options)
-        yield _make_result_message()
+        yield default_result_message
 
-    mocker.patch("adws.adw_modules.io_ops.query", side_effect=fake_query)
+    patched_query(fake_query)
 
     request = AdwsRequest(
         system_prompt="sys",
@@ -211,7 +259,9 @@ def test_execute_sdk_call_passes_options(mocker) -> None:  # type: ignore[no-unt
     assert opts.permission_mode == "bypassPermissions"
 
 
-def test_execute_sdk_call_no_result_message(mocker) -> None:  # type: ignore[no-untyped-def]
+def test_execute_sdk_call_no_result_message(
+    patched_query: PatchQuery,
+) -> None:
     """Test execute_sdk_call returns error when no ResultMessage."""
 
     async def fake_query(
@@ -219,7 +269,7 @@ def test_execute_sdk_call_no_result_message(mocker) -> None:  # type: ignore[no-
     ) -> Any:
         yield FakeOtherMessage()
 
-    mocker.patch("adws.adw_modules.io_ops.query", side_effect=fake_query)
+    patched_query(fake_query)
 
     request = AdwsRequest(system_prompt="sys", prompt="hello")
     result = execute_sdk_call(request)
@@ -231,101 +281,46 @@ def test_execute_sdk_call_no_result_message(mocker) -> None:  # type: ignore[no-
     assert "No ResultMessage" in error.message
 
 
-def test_execute_sdk_call_process_error(mocker) -> None:  # type: ignore[no-untyped-def]
-    """Test execute_sdk_call returns IOFailure on ProcessError."""
-
-    async def fake_query(
-        *, prompt: str, options: object = None
-    ) -> Any:
-        msg = "process failed"
-        raise ProcessError(msg, exit_code=1, stderr="boom")
-        yield  # pragma: no cover
-
-    mocker.patch("adws.adw_modules.io_ops.query", side_effect=fake_query)
-
-    request = AdwsRequest(system_prompt="sys", prompt="hello")
-    result = execute_sdk_call(request)
-
-    assert isinstance(result, IOFailure)
-    error = unsafe_perform_io(result.failure())
-    assert isinstance(error, PipelineError)
-    assert error.error_type == "ProcessError"
-
-
-def test_execute_sdk_call_connection_error(mocker) -> None:  # type: ignore[no-untyped-def]
-    """Test execute_sdk_call returns IOFailure on CLIConnectionError."""
-
-    async def fake_query(
-        *, prompt: str, options: object = None
-    ) -> Any:
-        msg = "connection refused"
-        raise CLIConnectionError(msg)
-        yield  # pragma: no cover
-
-    mocker.patch("adws.adw_modules.io_ops.query", side_effect=fake_query)
-
-    request = AdwsRequest(system_prompt="sys", prompt="hello")
-    result = execute_sdk_call(request)
-
-    assert isinstance(result, IOFailure)
-    error = unsafe_perform_io(result.failure())
-    assert isinstance(error, PipelineError)
-    assert error.error_type == "CLIConnectionError"
-
-
-def test_execute_sdk_call_cli_not_found(mocker) -> None:  # type: ignore[no-untyped-def]
-    """Test execute_sdk_call returns IOFailure on CLINotFoundError."""
-
-    async def fake_query(
-        *, prompt: str, options: object = None
-    ) -> Any:
-        msg = "CLI not installed"
-        raise CLINotFoundError(msg)
-        yield  # pragma: no cover
-
-    mocker.patch("adws.adw_modules.io_ops.query", side_effect=fake_query)
-
-    request = AdwsRequest(system_prompt="sys", prompt="hello")
-    result = execute_sdk_call(request)
-
-    assert isinstance(result, IOFailure)
-    error = unsafe_perform_io(result.failure())
-    assert isinstance(error, PipelineError)
-    assert error.error_type == "CLINotFoundError"
-
-
-def test_execute_sdk_call_json_decode_error(mocker) -> None:  # type: ignore[no-untyped-def]
-    """Test execute_sdk_call returns IOFailure on CLIJSONDecodeError."""
+def _raising_query(exc: Exception) -> Callable[..., Any]:
+    """Build a fake query whose first iteration raises exc."""
 
     async def fake_query(
         *, prompt: str, options: object = None
     ) -> Any:
-        msg = "bad json line"
-        raise CLIJSONDecodeError(msg, ValueError("parse"))
+        raise exc
         yield  # pragma: no cover
 
-    mocker.patch("adws.adw_modules.io_ops.query", side_effect=fake_query)
-
-    request = AdwsRequest(system_prompt="sys", prompt="hello")
-    result = execute_sdk_call(request)
-
-    assert isinstance(result, IOFailure)
-    error = unsafe_perform_io(result.failure())
-    assert isinstance(error, PipelineError)
-    assert error.error_type == "CLIJSONDecodeError"
-
-
-def test_execute_sdk_call_base_sdk_error(mocker) -> None:  # type: ignore[no-untyped-def]
-    """Test execute_sdk_call returns IOFailure on base ClaudeSDKError."""
-
-    async def fake_query(
-        *, prompt: str, options: object = None
-    ) -> Any:
-        msg = "unknown sdk error"
-        raise ClaudeSDKError(msg)
-        yield  # pragma: no cover
-
-    mocker.patch("adws.adw_modules.io_ops.query", side_effect=fake_query)
+    return fake_query
+
+
+# Rows: (expected error_type, exception raised by the SDK)
+_SDK_ERROR_CASES: list[tuple[str, Exception]] = [
+    (
+        "ProcessError",
+        ProcessError("process failed", exit_code=1, stderr="boom"),
+    ),
+    ("CLIConnectionError", CLIConnectionError("connection refused")),
+    ("CLINotFoundError", CLINotFoundError("CLI not installed")),
+    (
+        "CLIJSONDecodeError",
+        CLIJSONDecodeError("bad json line", ValueError("parse")),
+    ),
+    ("ClaudeSDKError", ClaudeSDKError("unknown sdk error")),
+]
+
+
+@pytest.mark.parametrize(
+    ("expected_type", "exc"),
+    _SDK_ERROR_CASES,
+    ids=[c[0] for c in _SDK_ERROR_CASES],
+)
+def test_execute_sdk_call_sdk_error(
+    patched_query: PatchQuery,
+    expected_type: str,
+    exc: Exception,
+) -> None:
+    """Test execute_sdk_call maps each SDK exception to IOFailure."""
+    patched_query(_raising_query(exc))
 
     request = AdwsRequest(system_prompt="sys", prompt="hello")
     result = execute_sdk_call(request)
@@ -333,7 +328,7 @@ def test_execute_sdk_call_base_sdk_error(mocker) -> None:  # type: ignore[no-unt
     assert isinstance(result, IOFailure)
     error = unsafe_perform_io(result.failure())
     assert isinstance(error, PipelineError)
-    assert error.error_type == "ClaudeSDKError"
+    assert error.error_type == expected_type
 
 
 # --- run_shell_command tests ---
@@ -1065,6 +1060,7 @@ def test_read_prime_file_not_found(tmp_path: Path) -> None:
     assert error.error_type == "FileNotFoundError"
 
 
+@_requires_chmod
 def test_read_prime_file_permission_error(
     tmp_path: Path,
 ) -> None:
@@ -1074,15 +1070,17 @@ def test_read_prime_file_permission_error(
     test_file.chmod(0o000)
     from unittest.mock import patch  # noqa: PLC0415
 
-    with patch(
-        "adws.adw_modules.io_ops._find_project_root",
-        return_value=tmp_path,
-    ):
-        result = read_prime_file("noperm.md")
-    assert isinstance(result, IOFailure)
-    error = unsafe_perform_io(result.failure())
-    assert error.error_type == "PermissionError"
-    test_file.chmod(0o644)
+    try:
+        with patch(
+            "adws.adw_modules.io_ops._find_project_root",
+            return_value=tmp_path,
+        ):
+            result = read_prime_file("noperm.md")
+        assert isinstance(result, IOFailure)
+        error = unsafe_perform_io(result.failure())
+        assert error.error_type == "PermissionError"
+    finally:
+        test_file.chmod(0o644)
 
 
 # --- get_directory_tree tests (Story 4.3) ---
@@ -1581,6 +1579,29 @@ def test_write_hook_log_appends_to_existing(
     )
 
 
+def test_write_hook_log_writes_utf8(
+    tmp_path: Path, mocker: Any,
+) -> None:
+    """write_hook_log encodes non-ASCII event text as UTF-8."""
+    from unittest.mock import patch  # noqa: PLC0415
+
+    with patch(
+        "adws.adw_modules.io_ops._find_project_root",
+        return_value=tmp_path,
+    ):
+        result = write_hook_log(
+            "sess-utf8", '{"name":"caf\u00e9"}',
+        )
+    assert isinstance(result, IOSuccess)
+    log_file = (
+        tmp_path / "agents" / "hook_logs"
+        / "sess-utf8.jsonl"
+    )
+    assert log_file.read_bytes() == (
+        '{"name":"caf\u00e9"}\n'.encode()
+    )
+
+
 def test_write_hook_log_creates_directory(
     tmp_path: Path, mocker: Any,
 ) -> None:
@@ -1950,6 +1971,7 @@ def test_read_context_bundle_not_found(
     assert "nonexistent" in error.message
 
 
+@_requires_chmod
 def test_read_context_bundle_permission_error(
     tmp_path: Path, mocker: Any,
 ) -> None:
@@ -1964,19 +1986,21 @@ def test_read_context_bundle_permission_error(
     bundle_file.write_text("data")
     bundle_file.chmod(0o000)
 
-    with patch(
-        "adws.adw_modules.io_ops._find_project_root",
-        return_value=tmp_path,
-    ):
-        result = read_context_bundle("session-noperm")
-    assert isinstance(result, IOFailure)
-    error = unsafe_perform_io(result.failure())
-    assert isinstance(error, PipelineError)
-    assert error.error_type == "ContextBundleReadError"
-    assert error.step_name == (
-        "io_ops.read_context_bundle"
-    )
-    bundle_file.chmod(0o644)
+    try:
+        with patch(
+            "adws.adw_modules.io_ops._find_project_root",
+            return_value=tmp_path,
+        ):
+            result = read_context_bundle("session-noperm")
+        assert isinstance(result, IOFailure)
+        error = unsafe_perform_io(result.failure())
+        assert isinstance(error, PipelineError)
+        assert error.error_type == "ContextBundleReadError"
+        assert error.step_name == (
+            "io_ops.read_context_bundle"
+        )
+    finally:
+        bundle_file.chmod(0o644)
 
 
 def test_read_context_bundle_os_error(
@@ -2333,6 +2357,7 @@ def test_read_bmad_file_not_found(
     assert error.error_type == "FileNotFoundError"
 
 
+@_requires_chmod
 def test_read_bmad_file_permission_error(
     tmp_path: Path,
 ) -> None:
@@ -2343,15 +2368,17 @@ def test_read_bmad_file_permission_error(
     test_file.write_text("secret")
     test_file.chmod(0o000)
 
-    with patch(
-        "adws.adw_modules.io_ops._find_project_root",
-        return_value=tmp_path,
-    ):
-        result = read_bmad_file("noperm.md")
-    assert isinstance(result, IOFailure)
-    error = unsafe_perform_io(result.failure())
-    assert error.error_type == "PermissionError"
-    test_file.chmod(0o644)
+    try:
+        with patch(
+            "adws.adw_modules.io_ops._find_project_root",
+            return_value=tmp_path,
+        ):
+            result = read_bmad_file("noperm.md")
+        assert isinstance(result, IOFailure)
+        error = unsafe_perform_io(result.failure())
+        assert error.error_type == "PermissionError"
+    finally:
+        test_file.chmod(0o644)
 
 
 def test_read_bmad_file_empty_path() -> None: